@@ -10,6 +10,11 @@ CAMERA_ZOOM_FACTOR = 0.1 # speed of the camera zoom, when using mouse wheel
 CAMERA_MIN_ZOOM = 0.3 # minimum zoom level
 CAMERA_MAX_ZOOM = 3.0 # maximum zoom level
 
+# level of detail. Below these zoom levels, the world is drawn with less detail
+LOD_LABEL_MIN_ZOOM = 0.6 # labels (items and generators) and glyphs are skipped
+LOD_ITEM_DOT_MIN_ZOOM = 0.45 # items are drawn as small colored dots
+LOD_MACHINE_SPRITE_MIN_ZOOM = 0.5 # machines use pre-shrunk sprites
+
 
 # Bottom Machine-selection GUI
 MACHINE_SELECTION_GUI_HEIGHT = 80
@@ -0,0 +1,87 @@
+import time
+import pygame
+from collections import deque
+
+from core.performance_tracker import performance_tracker
+
+# max. time per frame for loading queued assets (in seconds). At least one asset is loaded per frame.
+QUEUE_TIME_BUDGET = 0.004
+
+
+class AssetManager:
+    """
+    Central place to load fonts and images. Every asset is loaded only once, and then shared.
+      - images are identified by their path
+      - fonts by (name, size, bold). The name can be a font file (.ttf), a system font, or None for the default font.
+
+    preload() loads the assets for the first frame. queue() adds the rest, and load_queued() loads a few of them
+    per frame, so the first opening of a menu does not have to resolve its fonts.
+    Everything is loaded on the main thread: SDL_ttf and FreeType must not be used from two threads at once.
+    """
+    def __init__(self):
+        self.images: dict[str, pygame.Surface] = {}
+        self.fonts: dict[tuple[str | None, int, bool], pygame.font.Font] = {}
+        self._queue: deque = deque() # ("image", path) or ("font", (name, size, bold))
+
+    # ------------ fonts ------------
+    @staticmethod
+    def _create_font(name: str | None, size: int, bold: bool) -> pygame.font.Font:
+        if name and name.endswith(".ttf"):
+            font = pygame.font.Font(name, size)
+            font.set_bold(bold)
+            return font
+        return pygame.font.SysFont(name, size, bold=bold)
+
+    def get_font(self, name: str | None, size: int, bold=False) -> pygame.font.Font:
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self._create_font(name, size, bold)
+            self.fonts[key] = font
+        return font
+
+    # ------------ images ------------
+    def get_image(self, path: str) -> pygame.Surface:
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            self.images[path] = image
+        return image
+
+    # ------------ loading ------------
+    def preload(self, images=(), fonts=()):
+        """Load the assets now. fonts are tuples (name, size) or (name, size, bold)"""
+        for path in images:
+            self.get_image(path)
+        for font_key in fonts:
+            self.get_font(*font_key)
+
+    def queue(self, images=(), fonts=()):
+        """Load the assets later, with load_queued(). get_image() and get_font() can be used meanwhile."""
+        self._queue.extend(("image", path) for path in images)
+        self._queue.extend(("font", tuple(font_key)) for font_key in fonts)
+
+    def load_queued(self, time_budget=QUEUE_TIME_BUDGET) -> bool:
+        """Load queued assets, until the time budget is used up. Call this once per frame. Returns True, if assets are left."""
+        start = time.perf_counter()
+        while self._queue:
+            kind, key = self._queue.popleft()
+            if kind == "image":
+                try:
+                    self.get_image(key)
+                except (pygame.error, FileNotFoundError) as e:
+                    print(f"Warning: could not load image {key}: {e}")
+            else:
+                self.get_font(*key)
+
+            if time.perf_counter() - start >= time_budget:
+                break
+        return bool(self._queue)
+
+
+# global instance
+asset_manager = AssetManager()
+
+performance_tracker.register_counter(
+    "assets", lambda: f"{len(asset_manager.images)} images, {len(asset_manager.fonts)} fonts, {len(asset_manager._queue)} queued"
+)
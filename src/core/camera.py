@@ -13,15 +13,29 @@ class Camera():
 
         self.mouse_pos = pygame.mouse.get_pos()
         self.last_mouse_pos = (0, 0) # mouse-position, one frame before. (needed for drag-and-drop-feature)
-    
-    def get_visible_tile_bounds(self) -> Tuple[int, int, int, int]:
-        """Get the bounds of the visible area in tile coordinates"""
-        w, h = pygame.display.get_surface().get_size()
+
+        # the visible area of this frame. Computed once per frame in update_view(), and used by all render passes
+        self.view_rect: Tuple[float, float, float, float] | None = None # (x, y, width, height) in world coordinates
+        self.visible_tile_bounds: Tuple[int, int, int, int] | None = None # (left, right, top, bottom)
+
+    def update_view(self, screen_size: Tuple[int, int]):
+        """Compute the visible area for this frame. Call this once per frame, before rendering."""
+        w, h = screen_size
+        view_width = w / self.zoom
+        view_height = h / self.zoom
+        self.view_rect = (self.offset_x, self.offset_y, view_width, view_height)
+
         left = int(self.offset_x // TILE_SIZE)
         top = int(self.offset_y // TILE_SIZE)
-        right = int((self.offset_x + w / self.zoom) // TILE_SIZE) + 1
-        bottom = int((self.offset_y + h / self.zoom) // TILE_SIZE) + 1
-        return left, right, top, bottom
+        right = int((self.offset_x + view_width) // TILE_SIZE) + 1
+        bottom = int((self.offset_y + view_height) // TILE_SIZE) + 1
+        self.visible_tile_bounds = (left, right, top, bottom)
+    
+    def get_visible_tile_bounds(self) -> Tuple[int, int, int, int]:
+        """Get the bounds of the visible area in tile coordinates (of the current frame)"""
+        if self.visible_tile_bounds is None:
+            self.update_view(pygame.display.get_surface().get_size())
+        return self.visible_tile_bounds
 
     def move(self, dx, dy):
         self.offset_x += dx
@@ -1,14 +1,13 @@
-import pygame
-
 from core.utils import get_mouse_world_pos
 from config.constants import TILE_SIZE
 from config.settings_manager import settings_manager
 from core.performance_tracker import performance_tracker
+from core.asset_manager import asset_manager
 
 
 class Debug():
     def __init__(self):
-        self.font = pygame.font.SysFont(None, 16)
+        self.font = asset_manager.get_font(None, 16)
         self.text_color = (255, 255, 255)
 
     # --- Text helper ---
@@ -87,6 +86,12 @@ class Debug():
 
         return y
 
+    def draw_counters(self, screen, counters, x, y):
+        for name, value in counters.items():
+            self._draw_text(screen, f"{name}: {value}", x, y)
+            y += 18
+        return y
+
     def draw(self, screen, camera, clock):
         if settings_manager.get("debug.show_coords"):
             self.draw_coordinates(screen, camera)
@@ -96,5 +101,6 @@ class Debug():
         
         if settings_manager.get("debug.show_performance"):
             tree = self.build_tree(performance_tracker.get_data(smoothed=True))
-            self.draw_tree(screen, tree, 10, 60)
+            y = self.draw_tree(screen, tree, 10, 60)
+            self.draw_counters(screen, performance_tracker.get_counters(), 10, y + 10)
         
\ No newline at end of file
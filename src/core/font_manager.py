@@ -0,0 +1,50 @@
+import pygame
+from collections import OrderedDict
+
+from core.performance_tracker import performance_tracker
+from core.asset_manager import asset_manager
+
+# font sizes are rounded to a multiple of this, so zooming does not create a new font for every pixel size
+FONT_SIZE_STEP = 2
+# max. number of rendered texts in the cache
+TEXT_CACHE_SIZE = 256
+
+
+class FontManager:
+    """
+    Fonts of zoomable texts. The font sizes are quantized into buckets, and the fonts are loaded by the asset manager.
+    Small texts that are drawn every frame (like the generator letters) are also cached as rendered surfaces.
+    """
+    def __init__(self, text_cache_size=TEXT_CACHE_SIZE):
+        self.texts: OrderedDict[tuple, pygame.Surface] = OrderedDict() # (path, size bucket, text, color) -> surface
+        self.text_cache_size = text_cache_size
+
+    @staticmethod
+    def size_bucket(size: float) -> int:
+        return max(FONT_SIZE_STEP, round(size / FONT_SIZE_STEP) * FONT_SIZE_STEP)
+
+    def get_font(self, path: str | None, size: float) -> pygame.font.Font:
+        """Get the font of the file (or the default font for None) in the size bucket of size"""
+        return asset_manager.get_font(path, self.size_bucket(size))
+
+    def render(self, path: str | None, size: float, text: str, color) -> pygame.Surface:
+        """Render the text, or get it from the cache"""
+        key = (path, self.size_bucket(size), text, tuple(color))
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.texts.move_to_end(key)
+            return surface
+
+        surface = self.get_font(path, size).render(text, True, color)
+        self.texts[key] = surface
+        if len(self.texts) > self.text_cache_size:
+            self.texts.popitem(last=False)
+        return surface
+
+
+# global instance
+font_manager = FontManager()
+
+performance_tracker.register_counter(
+    "texts", lambda: f"{len(font_manager.texts)}/{font_manager.text_cache_size}"
+)
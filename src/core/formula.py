@@ -1,88 +1,184 @@
 from abc import ABC, abstractmethod
+from core.formula_arena import (
+    formula_arena, KIND_VARIABLE, KIND_CONSTANT, KIND_NOT, KIND_BINARY_OP, OPERATOR_CODES, OPERATOR_SYMBOLS, NO_OPERATOR, NO_CHILD
+)
+
 
 class Formula(ABC):
-    @abstractmethod
+    """
+    Base class of all formula nodes.
+    Formulas are hash-consed: constructing a formula that is structurally equal to an
+    existing one returns the existing object. So equality is just an identity check,
+    and the hash is just the id.
+    Every node is the view of one row in the formula_arena, and node.id is the id of this row.
+    The row is freed, when the node is garbage collected. (see FormulaArena)
+    Formulas are immutable. Never change the attributes of a node after construction.
+
+    Each node also has some metrics, so that menus and machines don't have to walk the tree:
+        size:          number of nodes
+        depth:         nesting depth of the connectives (0 for variables and constants)
+        top_op:        the top connective ("->", "+", "*", "-") or None
+        variable_mask: set of the variables as bitmask (bit = name id in the formula_arena)
+        canonical:     the string of the formula (computed lazily, same as str())
+    size and depth are stored in the row, and computed from the children when the row is added, so this is O(1).
+    variable_mask is collected from the rows, when it's needed. (only the Hub's entailment check uses it)
+    The nodes themselves only store what the row can't. (like this, a formula needs less memory)
+    """
+    __slots__ = ("id", "_canonical", "__weakref__")
+
+    @classmethod
+    def _intern(cls, kind: int, op: int = NO_OPERATOR, left: int = NO_CHILD, right: int = NO_CHILD, name: int = 0):
+        """
+        Returns (node, is_new). If is_new is True, the caller has to initialize the attributes.
+        """
+        node = formula_arena.find_view(kind, op, left, right, name)
+        if node is not None:
+            return node, False
+
+        # note: the children stay alive through the attributes of the node, so their ids stay valid
+
+        node = object.__new__(cls)
+        node.id = formula_arena.add(kind, op, left, right, name, node)
+        node._canonical = None
+        return node, True
+
     def __str__(self):
-        pass
+        # memoized: the string is rendered only once per node
+        if self._canonical is None:
+            self._canonical = self._render()
+        return self._canonical
+
+    def _render(self) -> str:
+        """
+        Render the formula without recursion. (so this also works for very deep formulas)
+        Subformulas that already have a string are not rendered again, their string is just reused.
+        """
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif node._canonical is not None:
+                parts.append(node._canonical)
+            else:
+                node._push_parts(stack)
+        return "".join(parts)
 
     @abstractmethod
-    def __eq__(self, other):
+    def _push_parts(self, stack: list):
+        """Push the parts of the string (strings or subformulas) to the stack, in reverse order"""
         pass
 
-    @abstractmethod
+    def __eq__(self, other):
+        # structurally equal formulas are the same object
+        return self is other
+
     def __hash__(self):
-        pass
+        # structurally equal formulas are the same object, and there is one live object per id
+        return self.id
 
+    @property
+    def canonical(self) -> str:
+        return str(self)
 
-class Variable(Formula):
-    def __init__(self, name: str):
-        self.name = name
+    @property
+    def size(self) -> int:
+        return formula_arena.sizes[self.id]
 
-    def __str__(self):
-        return self.name
+    @property
+    def depth(self) -> int:
+        return formula_arena.depths[self.id]
 
-    def __eq__(self, other):
-        return isinstance(other, Variable) and self.name == other.name
+    @property
+    def variable_mask(self) -> int:
+        return formula_arena.variable_mask(self.id)
 
-    def __hash__(self):
-        return hash(self.name)
+    @property
+    def assumption_bit(self) -> int:
+        """Bit of this formula in assumption masks. (0, if it was never used as an assumption)"""
+        return formula_arena.assumption_bit(self.id)
 
 
-class Constant(Formula):
-    def __init__(self, value: bool):
-        self.value = value
+class Variable(Formula):
+    __slots__ = ("name",)
+    top_op = None
 
-    def __str__(self):
-        return "T" if self.value else "F"
+    def __new__(cls, name: str):
+        name_id = formula_arena.name_id(name)
+        self, is_new = cls._intern(KIND_VARIABLE, name=name_id)
+        if is_new:
+            self.name = name
+        return self
 
-    def __eq__(self, other):
-        return isinstance(other, Constant) and self.value == other.value
+    def _push_parts(self, stack):
+        stack.append(self.name)
 
-    def __hash__(self):
-        return hash(self.value)
+
+class Constant(Formula):
+    __slots__ = ("value",)
+    top_op = None
+
+    def __new__(cls, value: bool):
+        value = bool(value)
+        self, is_new = cls._intern(KIND_CONSTANT, name=int(value))
+        if is_new:
+            self.value = value
+        return self
+
+    def _push_parts(self, stack):
+        stack.append("T" if self.value else "F")
 
 
 class Not(Formula):
-    def __init__(self, inner: Formula):
-        self.inner = inner
+    __slots__ = ("inner",)
+    top_op = "-"
 
-    def __str__(self):
-        inner_str = str(self.inner)
+    def __new__(cls, inner: Formula):
+        self, is_new = cls._intern(KIND_NOT, left=inner.id)
+        if is_new:
+            self.inner = inner
+        return self
+
+    def _push_parts(self, stack):
+        # "-inner" or "-(inner)"
         if isinstance(self.inner, BinaryOp):
-            inner_str = f"({inner_str})"
-        return f"-{inner_str}"
+            stack.extend((")", self.inner, "(", "-"))
+        else:
+            stack.extend((self.inner, "-"))
 
-    def __eq__(self, other):
-        return isinstance(other, Not) and self.inner == other.inner
 
-    def __hash__(self):
-        return hash(self.inner)
+class BinaryOp(Formula):
+    __slots__ = ("left", "right")
 
+    def __new__(cls, op: str, left: Formula, right: Formula):
+        self, is_new = cls._intern(KIND_BINARY_OP, OPERATOR_CODES[op], left.id, right.id)
+        if is_new:
+            self.left = left
+            self.right = right
+        return self
 
-class BinaryOp(Formula):
-    def __init__(self, op: str, left: Formula, right: Formula):
-        self.op = op
-        self.left = left
-        self.right = right
+    @property
+    def op(self) -> str:
+        return OPERATOR_SYMBOLS[formula_arena.ops[self.id]]
 
-    def __str__(self):
-        left_str = str(self.left)
-        right_str = str(self.right)
+    @property
+    def top_op(self) -> str:
+        return self.op
 
-        if isinstance(self.left, BinaryOp) and self._priority(self.left.op) <= self._priority(self.op):
-            left_str = f"({left_str})"
+    def _push_parts(self, stack):
+        # "left op right". Children with the same or a weaker operator get brackets.
         if isinstance(self.right, BinaryOp) and self._priority(self.right.op) <= self._priority(self.op):
-            right_str = f"({right_str})"
+            stack.extend((")", self.right, "("))
+        else:
+            stack.append(self.right)
 
-        return f"{left_str} {self.op} {right_str}"
+        stack.append(f" {self.op} ")
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, BinaryOp) and
-            self.op == other.op and
-            self.left == other.left and
-            self.right == other.right
-        )
+        if isinstance(self.left, BinaryOp) and self._priority(self.left.op) <= self._priority(self.op):
+            stack.extend((")", self.left, "("))
+        else:
+            stack.append(self.left)
 
     def _priority(self, op: str) -> int:
         return {
@@ -91,6 +187,3 @@ class BinaryOp(Formula):
             '+': 1,
             '->': 0,
         }.get(op, -1)
-
-    def __hash__(self):
-        return hash((self.op, self.left, self.right))
@@ -0,0 +1,232 @@
+import weakref
+from array import array
+
+# node kinds
+KIND_VARIABLE = 0
+KIND_CONSTANT = 1
+KIND_NOT = 2
+KIND_BINARY_OP = 3
+
+# binary operators are stored as small numbers
+OPERATOR_SYMBOLS = ["->", "+", "*"]
+OPERATOR_CODES = {symbol: code for code, symbol in enumerate(OPERATOR_SYMBOLS)}
+
+NO_OPERATOR = -1
+NO_CHILD = -1
+
+
+class _ViewRef(weakref.ref):
+    """Weak reference to the Formula view of a row. It carries the row id, so all rows share one callback."""
+    __slots__ = ("formula_id",)
+
+    def __new__(cls, view, callback, formula_id):
+        self = super().__new__(cls, view, callback)
+        self.formula_id = formula_id
+        return self
+
+    def __init__(self, view, callback, formula_id):
+        super().__init__(view, callback)
+
+
+class FormulaArena:
+    """
+    Compact storage of all distinct formulas of the session.
+    Every formula is one row in array-backed tables, and the id of a formula is its row index:
+        kinds[id]:  node kind (KIND_...)
+        ops[id]:    operator code (only binary nodes)
+        lefts[id]:  id of the left child (binary nodes), or of the inner formula (Not)
+        rights[id]: id of the right child (binary nodes)
+        names[id]:  id of the variable name in name_table, or 0/1 for the constants F/T
+        sizes[id]:  number of nodes of the formula
+        depths[id]: nesting depth of the connectives
+        pins[id]:   number of retain() calls without release()
+
+    So the rest of the game can refer to formulas by small integer ids.
+    The Formula objects are just a view of a row. (used for the machine rules, rendering and str())
+    There is exactly one view per row, so structurally equal formulas are the same object.
+    The views only store what the rows can't: the id, the children (to keep them alive) and the cached string.
+
+    The arena only holds weak references to the views. When a formula is not used anymore (no item, key,
+    or parent formula refers to it), its row is freed and reused for the next new formula.
+    So the arena does not grow with all intermediate formulas of a session.
+    Everything that stores only a formula id has to keep the row alive with retain() / release(). (like TheoremKey)
+    Formulas used as assumptions are kept alive, because their bits in the assumption masks are never reused.
+    """
+    def __init__(self):
+        self.kinds = array("b")
+        self.ops = array("b")
+        self.lefts = array("i")
+        self.rights = array("i")
+        self.names = array("i")
+        self.sizes = array("i")
+        self.depths = array("i")
+        self.pins = array("i")
+
+        self.name_table: list[str] = []
+        self._name_ids: dict[str, int] = {}
+
+        self._views: dict[int, _ViewRef] = {} # packed row -> weak reference to the Formula
+        self._free_ids: list[int] = []
+        self._free_callback = self._free # one callback for all weak references
+        self._pinned: dict[int, object] = {} # formula id -> Formula, for the rows with pins
+
+        # formulas that are used as assumptions get a dense index, so that a set of assumptions is just a bitmask.
+        self.assumption_ids = array("i") # index -> formula id
+        self._assumption_indices: dict[int, int] = {} # formula id -> index
+        self._assumption_formulas: list = [] # keeps the assumption formulas alive
+
+    def __len__(self):
+        """Number of formulas in the arena (without the free rows)"""
+        return len(self.kinds) - len(self._free_ids)
+
+    def name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self.name_table)
+            self.name_table.append(name)
+            self._name_ids[name] = name_id
+        return name_id
+
+    @staticmethod
+    def _pack_row(kind: int, op: int, left: int, right: int, name: int) -> int:
+        # one int instead of a tuple, to keep the lookup table small. Only the fields of the kind are packed,
+        # so the int stays below 2**60 (32 bytes) for the first 2**25 rows.
+        if kind == KIND_BINARY_OP:
+            return ((left << 31 | right) << 2 | op) << 2 | kind
+        if kind == KIND_NOT:
+            return left << 2 | kind
+        return name << 2 | kind
+
+    def _packed_row_of(self, formula_id: int) -> int:
+        return self._pack_row(
+            self.kinds[formula_id], self.ops[formula_id], self.lefts[formula_id], self.rights[formula_id], self.names[formula_id]
+        )
+
+    def find(self, kind: int, op: int, left: int, right: int, name: int) -> int | None:
+        """Get the id of the row, or None if this formula does not exist yet"""
+        view_ref = self._views.get(self._pack_row(kind, op, left, right, name))
+        return None if view_ref is None else view_ref.formula_id
+
+    def find_view(self, kind: int, op: int, left: int, right: int, name: int):
+        """Get the Formula object of the row, or None if this formula does not exist yet"""
+        view_ref = self._views.get(self._pack_row(kind, op, left, right, name))
+        return None if view_ref is None else view_ref()
+
+    def add(self, kind: int, op: int, left: int, right: int, name: int, view) -> int:
+        """Add a new row and its Formula view. Returns the id of the row. (a free row is reused, if possible)"""
+        # size and depth are computed from the rows of the children, so this is O(1)
+        if kind == KIND_BINARY_OP:
+            size = self.sizes[left] + self.sizes[right] + 1
+            depth = max(self.depths[left], self.depths[right]) + 1
+        elif kind == KIND_NOT:
+            size = self.sizes[left] + 1
+            depth = self.depths[left] + 1
+        else:
+            size = 1
+            depth = 0
+
+        if self._free_ids:
+            formula_id = self._free_ids.pop()
+            self.kinds[formula_id] = kind
+            self.ops[formula_id] = op
+            self.lefts[formula_id] = left
+            self.rights[formula_id] = right
+            self.names[formula_id] = name
+            self.sizes[formula_id] = size
+            self.depths[formula_id] = depth
+        else:
+            formula_id = len(self.kinds)
+            self.kinds.append(kind)
+            self.ops.append(op)
+            self.lefts.append(left)
+            self.rights.append(right)
+            self.names.append(name)
+            self.sizes.append(size)
+            self.depths.append(depth)
+            self.pins.append(0)
+
+        self._views[self._pack_row(kind, op, left, right, name)] = _ViewRef(view, self._free_callback, formula_id)
+        return formula_id
+
+    def _free(self, view_ref: _ViewRef):
+        # called, when the view of the row is garbage collected
+        packed_row = self._packed_row_of(view_ref.formula_id)
+        if self._views.get(packed_row) is view_ref:
+            del self._views[packed_row]
+        self._free_ids.append(view_ref.formula_id)
+
+    def view(self, formula_id: int):
+        """Get the Formula object of a row"""
+        return self._views[self._packed_row_of(formula_id)]()
+
+    def retain(self, formula_id: int):
+        """Keep the row (and its view) alive, also if only the id is stored somewhere"""
+        if self.pins[formula_id] == 0:
+            self._pinned[formula_id] = self.view(formula_id)
+        self.pins[formula_id] += 1
+
+    def release(self, formula_id: int):
+        """Undo one retain(). The row is freed, when nothing else uses the formula"""
+        self.pins[formula_id] -= 1
+        if self.pins[formula_id] == 0:
+            del self._pinned[formula_id]
+
+    def variable_mask(self, formula_id: int) -> int:
+        """The variables of the formula as bitmask (bit = name id)"""
+        mask = 0
+        stack = [formula_id]
+        seen = set()
+        while stack:
+            formula_id = stack.pop()
+            if formula_id in seen:
+                continue
+            seen.add(formula_id)
+
+            kind = self.kinds[formula_id]
+            if kind == KIND_VARIABLE:
+                mask |= 1 << self.names[formula_id]
+            elif kind == KIND_NOT:
+                stack.append(self.lefts[formula_id])
+            elif kind == KIND_BINARY_OP:
+                stack.append(self.lefts[formula_id])
+                stack.append(self.rights[formula_id])
+        return mask
+
+    # --------------- assumption masks ----------------
+    def assumption_bit(self, formula_id: int) -> int:
+        """Bit of the formula in assumption masks, or 0 if the formula was never used as an assumption"""
+        index = self._assumption_indices.get(formula_id)
+        return 0 if index is None else 1 << index
+
+    def add_assumption(self, formula_id: int) -> int:
+        """Get the bit of the formula in assumption masks. A new bit is assigned, if necessary."""
+        index = self._assumption_indices.get(formula_id)
+        if index is None:
+            index = len(self.assumption_ids)
+            self.assumption_ids.append(formula_id)
+            self._assumption_indices[formula_id] = index
+            self._assumption_formulas.append(self.view(formula_id))
+        return 1 << index
+
+    def assumption_mask(self, formulas) -> int:
+        mask = 0
+        for formula in formulas:
+            mask |= self.add_assumption(formula.id)
+        return mask
+
+    def assumption_views(self, mask: int) -> list:
+        """Get the Formula objects of all bits in the mask"""
+        formulas = []
+        while mask:
+            lowest_bit = mask & -mask
+            formulas.append(self._assumption_formulas[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return formulas
+
+    def operator(self, formula_id: int) -> str | None:
+        op = self.ops[formula_id]
+        return OPERATOR_SYMBOLS[op] if op != NO_OPERATOR else None
+
+
+# global instance. All formulas live here.
+formula_arena = FormulaArena()
@@ -1,65 +1,131 @@
+import re
+from functools import lru_cache
 from core.formula import Formula, Constant, Not, BinaryOp, Variable
+from core.performance_tracker import performance_tracker
 
 OPERATORS = ["->", "+", "*"]
 OP_PRIORITY = {"->": 0, "+": 1, "*": 1, "-": 2}
 
-# TODO: understand and test the parser. (because it is AI-generated xD)
+# max. number of formula strings that are remembered by parse_formula
+PARSE_CACHE_SIZE = 4096
+
+# one token per match: an operator, a bracket or a name (variable or constant)
+_TOKEN_PATTERN = re.compile(r"\s*(?:(->|[-+*()])|([A-Za-z0-9_]+))")
+
+
+class FormulaParseError(ValueError):
+    """Raised, if a string is not a valid formula. position is the index of the bad character."""
+    def __init__(self, message: str, text: str, position: int):
+        super().__init__(f"{message} at position {position}: {text!r}")
+        self.text = text
+        self.position = position
+
+
+def tokenize(s: str) -> list[tuple[str, str, int]]:
+    """
+    Split the string into tokens (kind, value, position).
+    kind is "op", "(", ")" or "name".
+    """
+    tokens = []
+    pos = 0
+    end = len(s.rstrip())
+
+    while pos < end:
+        match = _TOKEN_PATTERN.match(s, pos)
+        if not match:
+            # skip the whitespace, to report the position of the bad character itself
+            bad_pos = len(s) - len(s[pos:].lstrip())
+            raise FormulaParseError(f"Unexpected character {s[bad_pos]!r}", s, bad_pos)
+
+        symbol, name = match.group(1), match.group(2)
+        if symbol in ("(", ")"):
+            tokens.append((symbol, symbol, match.start(1)))
+        elif symbol:
+            tokens.append(("op", symbol, match.start(1)))
+        else:
+            tokens.append(("name", name, match.start(2)))
+        pos = match.end()
+
+    return tokens
+
+
+# save files repeat the same formula strings very often. Formulas are immutable and shared,
+# so we can just return the same object again.
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_formula(s: str) -> Formula:
-    s = s.strip()
-    if not s:
-        raise ValueError("Empty formula string")
-
-    # 1) constants
-    if s == "T":
-        return Constant(True)
-    elif s == "F":
-        return Constant(False)
-
-    # 2) negation
-    if s.startswith("-"):
-        inner = parse_formula(s[1:])
-        return Not(inner)
-
-    # 3) brackets
-    if s.startswith("(") and s.endswith(")"):
-        depth = 0
-        for i, c in enumerate(s):
-            if c == "(":
-                depth += 1
-            elif c == ")":
-                depth -= 1
-                if depth == 0 and i < len(s) - 1:
-                    break
+    """
+    Parse a formula like "(a * b) + -c -> T".
+    Grammar (from weakest to strongest binding): "->", then "+" and "*", then the prefix "-".
+    All binary operators are left-associative. T and F are the constants.
+
+    This is an iterative operator-precedence parser (shunting-yard),
+    so it runs in linear time and does not recurse, even for very long or deeply nested formulas.
+    """
+    tokens = tokenize(s)
+    if not tokens:
+        raise FormulaParseError("Empty formula string", s, 0)
+
+    operands: list[Formula] = []
+    operators: list[tuple[str, int]] = [] # (operator or "(", position). The prefix-negation is stored as "-"
+    expect_operand = True
+
+    def reduce():
+        op, _ = operators.pop()
+        if op == "-":
+            operands.append(Not(operands.pop()))
+        else:
+            right = operands.pop()
+            left = operands.pop()
+            operands.append(BinaryOp(op, left, right))
+
+    for kind, value, pos in tokens:
+        if expect_operand:
+            if kind == "name":
+                if value == "T":
+                    operands.append(Constant(True))
+                elif value == "F":
+                    operands.append(Constant(False))
+                else:
+                    operands.append(Variable(value))
+                expect_operand = False
+            elif kind == "(":
+                operators.append(("(", pos))
+            elif kind == "op" and value == "-":
+                # prefix-negation binds stronger than everything, so it never reduces other operators
+                operators.append(("-", pos))
+            else:
+                raise FormulaParseError(f"Expected a formula, got {value!r}", s, pos)
+
         else:
-            # remove outer bracket
-            return parse_formula(s[1:-1])
-
-    # 4) binary operators: split it in 2 formulas (and apply recursion)
-    depth = 0
-    min_priority = float("inf")
-    split_index = -1
-    op_found = None
-
-    for i in range(len(s)):
-        c = s[i]
-        if c == "(":
-            depth += 1
-        elif c == ")":
-            depth -= 1
-        elif depth == 0:
-            for op in OPERATORS:
-                if s[i:i+len(op)] == op:
-                    priority = OP_PRIORITY[op]
-                    if priority <= min_priority:
-                        min_priority = priority
-                        split_index = i
-                        op_found = op
-                    break
-
-    if split_index != -1 and op_found:
-        left = parse_formula(s[:split_index])
-        right = parse_formula(s[split_index + len(op_found):])
-        return BinaryOp(op_found, left, right)
-
-    # 5) variables
-    return Variable(s)
\ No newline at end of file
+            if kind == "op" and value in OPERATORS:
+                # all binary operators are left-associative: reduce everything that binds at least as strong
+                priority = OP_PRIORITY[value]
+                while operators and operators[-1][0] != "(" and OP_PRIORITY[operators[-1][0]] >= priority:
+                    reduce()
+                operators.append((value, pos))
+                expect_operand = True
+            elif kind == ")":
+                while operators and operators[-1][0] != "(":
+                    reduce()
+                if not operators:
+                    raise FormulaParseError("Unmatched ')'", s, pos)
+                operators.pop() # remove the "("
+            else:
+                raise FormulaParseError(f"Expected an operator, got {value!r}", s, pos)
+
+    if expect_operand:
+        raise FormulaParseError("Unexpected end of formula", s, len(s))
+
+    while operators:
+        if operators[-1][0] == "(":
+            raise FormulaParseError("Unmatched '('", s, operators[-1][1])
+        reduce()
+
+    return operands[0]
+
+
+def _parse_cache_counter() -> str:
+    info = parse_formula.cache_info()
+    return f"{info.hits} hits, {info.misses} misses ({info.currsize}/{info.maxsize})"
+
+performance_tracker.register_counter("parse cache", _parse_cache_counter)
@@ -62,6 +62,10 @@ class InputHandler:
         """Check if mouse button was pressed this frame (flank detection)"""
         return self.events_this_frame.get(f'mouse_down_{button}', False)
         
+    def was_mouse_released(self, button):
+        """Check if mouse button was released this frame"""
+        return self.events_this_frame.get(f'mouse_up_{button}', False)
+        
     def get_mouse_press_pos(self, button):
         """Get position where mouse button was pressed this frame"""
         return self.events_this_frame.get(f'mouse_down_{button}_pos')
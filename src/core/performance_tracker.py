@@ -9,6 +9,11 @@ class PerformanceTracker:
         self.last_frame = {}
         self.smoothed = {}
         self.smoothing = smoothing
+        self.counters = {} # name -> function, that returns the current value
+
+    def register_counter(self, name, getter):
+        """Register a value, that is shown in the performance overlay. (for example cache hits)"""
+        self.counters[name] = getter
 
     def start(self, name):
         self.sections[name] = time.perf_counter()
@@ -32,6 +37,9 @@ class PerformanceTracker:
     def get_data(self, smoothed=True):
         return self.smoothed if smoothed else self.last_frame
 
+    def get_counters(self):
+        return {name: getter() for name, getter in self.counters.items()}
+
 
 # global singleton instance
 performance_tracker = PerformanceTracker()
\ No newline at end of file
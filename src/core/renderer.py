@@ -14,6 +14,9 @@ class Renderer:
         
     def render_game_world(self, grid, camera):
         """Render the main game world elements"""
+        # the visible area is computed once, and shared by all passes
+        camera.update_view(self.screen.get_size())
+
         performance_tracker.start("render.grid")
         grid.draw_grid_lines(self.screen, camera)
         performance_tracker.end("render.grid")
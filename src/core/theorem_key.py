@@ -1,13 +1,57 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from core.formula import Formula
+from core.formula_arena import formula_arena
 from core.formula_parser import parse_formula
 
-@dataclass(frozen=True)
+# eq=False: we define __eq__ and __hash__ ourselves, to use the cached hash.
+@dataclass(frozen=True, eq=False, slots=True)
 class TheoremKey:
-    formula: Formula
-    assumptions: frozenset[Formula]
+    # the formula is stored as its id in the formula_arena. (small int instead of a tree)
+    formula_id: int
+    # the assumptions are a bitmask over the assumption-bits of the formula_arena.
+    # Union, difference and subset are just integer operations: |, & ~, (a & b) == a
+    assumption_mask: int
     is_theorem: bool
+    # computed once in __post_init__. The keys are hashed on every Hub.add, Hub.count and hub-output
+    _hash: int = field(init=False, repr=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.formula_id, self.assumption_mask, self.is_theorem)))
+        # the key only stores the id, so the row of the formula is kept alive in the arena, as long as the key exists
+        formula_arena.retain(self.formula_id)
+
+    def __del__(self):
+        formula_arena.release(self.formula_id)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, TheoremKey) or self._hash != other._hash:
+            return False
+        return (
+            self.formula_id == other.formula_id and
+            self.assumption_mask == other.assumption_mask and
+            self.is_theorem == other.is_theorem
+        )
+
+    @staticmethod
+    def create(formula: Formula, assumptions, is_theorem: bool) -> "TheoremKey":
+        return TheoremKey(formula.id, formula_arena.assumption_mask(assumptions), is_theorem)
+
+    @property
+    def formula(self) -> Formula:
+        return formula_arena.view(self.formula_id)
+
+    @property
+    def assumptions(self) -> frozenset[Formula]:
+        """The assumptions as a set of formulas. (used by the UI)"""
+        return frozenset(formula_arena.assumption_views(self.assumption_mask))
+
+    def has_assumption(self, formula: Formula) -> bool:
+        return bool(self.assumption_mask & formula.assumption_bit)
 
     def to_data(self) -> dict:
         return {
@@ -20,7 +64,7 @@ class TheoremKey:
     def from_data(data: dict) -> "TheoremKey":
         formula = parse_formula(data["formula"])
         assumptions_strings = data.get("assumptions", [])
-        assumptions = frozenset(parse_formula(a) for a in assumptions_strings)
+        assumptions = [parse_formula(a) for a in assumptions_strings]
         is_theorem = data["is_theorem"]
 
-        return TheoremKey(formula, assumptions, is_theorem)
+        return TheoremKey.create(formula, assumptions, is_theorem)
@@ -0,0 +1,103 @@
+from core.formula import Formula, Variable, Constant, Not, BinaryOp
+from core.formula_arena import formula_arena
+
+# 2^20 rows. With more variables, the check would take too long.
+MAX_VARIABLES = 20
+
+
+class TruthTable:
+    """
+    Bit-parallel evaluation of formulas over all assignments of some variables.
+    Row r of the truth table assigns True to the i-th variable, if bit i of r is set.
+    A formula is evaluated to one big int: bit r is set, if the formula is True in row r.
+    So one integer operation evaluates a connective for all 2^n assignments at once.
+    """
+    def __init__(self, variable_mask: int):
+        name_ids = []
+        while variable_mask:
+            lowest_bit = variable_mask & -variable_mask
+            name_ids.append(lowest_bit.bit_length() - 1)
+            variable_mask ^= lowest_bit
+
+        if len(name_ids) > MAX_VARIABLES:
+            raise ValueError(f"Too many variables for a truth table: {len(name_ids)} (max. {MAX_VARIABLES})")
+
+        num_rows = 1 << len(name_ids)
+        self.all_rows = (1 << num_rows) - 1
+        self.columns = {
+            name_id: self._variable_column(index, num_rows) for index, name_id in enumerate(name_ids)
+        }
+
+    @staticmethod
+    def _variable_column(index: int, num_rows: int) -> int:
+        # blocks of 2^index zeros and 2^index ones, repeated. Like 0b...11110000 for index 2
+        width = 1 << index
+        column = ((1 << width) - 1) << width
+        width *= 2
+        while width < num_rows:
+            column |= column << width
+            width *= 2
+        return column
+
+    def evaluate(self, formula: Formula) -> int:
+        """Get the rows (as bits), where the formula is True. Shared subformulas are evaluated only once."""
+        values: dict[int, int] = {} # formula id -> rows
+        stack = [formula]
+        while stack:
+            node = stack[-1]
+            if node.id in values:
+                stack.pop()
+                continue
+
+            if isinstance(node, Variable):
+                values[node.id] = self.columns[formula_arena.names[node.id]]
+            elif isinstance(node, Constant):
+                values[node.id] = self.all_rows if node.value else 0
+            elif isinstance(node, Not):
+                if node.inner.id not in values:
+                    stack.append(node.inner)
+                    continue
+                values[node.id] = self.all_rows ^ values[node.inner.id]
+            elif isinstance(node, BinaryOp):
+                missing = [child for child in (node.left, node.right) if child.id not in values]
+                if missing:
+                    stack.extend(missing)
+                    continue
+                left = values[node.left.id]
+                right = values[node.right.id]
+                if node.op == "*":
+                    values[node.id] = left & right
+                elif node.op == "+":
+                    values[node.id] = left | right
+                else: # "->"
+                    values[node.id] = (self.all_rows ^ left) | right
+            stack.pop()
+
+        return values[formula.id]
+
+
+def entails(assumptions, formula: Formula) -> bool:
+    """Check, if the formula is True in every assignment, where all assumptions are True"""
+    assumptions = list(assumptions)
+    variable_mask = formula.variable_mask
+    for assumption in assumptions:
+        variable_mask |= assumption.variable_mask
+
+    table = TruthTable(variable_mask)
+    rows = table.all_rows
+    for assumption in assumptions:
+        rows &= table.evaluate(assumption)
+
+    # no row where the assumptions are True, but the formula is False
+    return rows & ~table.evaluate(formula) == 0
+
+
+def is_tautology(formula: Formula) -> bool:
+    return entails([], formula)
+
+
+def count_variables(formulas) -> int:
+    variable_mask = 0
+    for formula in formulas:
+        variable_mask |= formula.variable_mask
+    return variable_mask.bit_count()
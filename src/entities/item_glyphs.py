@@ -0,0 +1,218 @@
+import math
+import zlib
+import colorsys
+import pygame
+from collections import OrderedDict
+
+from core.formula import Formula, Variable, Constant, Not, BinaryOp
+from core.performance_tracker import performance_tracker
+from entities.item_labels import ZOOM_BUCKET_SIZE
+
+# size of one glyph in the atlas (in pixels). Big enough to look sharp at the max. zoom.
+GLYPH_SIZE = 64
+# the atlas is a grid of ATLAS_COLUMNS x ATLAS_COLUMNS glyphs. It gets more rows, if more glyphs are visible at once.
+ATLAS_COLUMNS = 16
+# number of nesting rings. Deeper subformulas only change the color of the center.
+MAX_RINGS = 4
+
+CONNECTIVE_COLORS = {
+    "->": (70, 110, 220),
+    "+": (60, 170, 90),
+    "*": (210, 70, 60),
+    "-": (150, 80, 190),
+}
+CONSTANT_COLORS = {True: (250, 250, 250), False: (40, 40, 40)}
+OUTLINE_COLOR = (0, 0, 0)
+
+
+def _stable_hash(text: str) -> int:
+    # hash() of a string changes with every start of python. The glyphs have to look the same in every session.
+    return zlib.crc32(text.encode())
+
+
+def _variable_color(formula: Variable) -> tuple[int, int, int]:
+    hue = (_stable_hash(formula.name) & 0xFFFF) / 0x10000
+    r, g, b = colorsys.hsv_to_rgb(hue, 0.45, 0.95)
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+def node_color(formula: Formula) -> tuple[int, int, int]:
+    if isinstance(formula, Variable):
+        return _variable_color(formula)
+    if isinstance(formula, Constant):
+        return CONSTANT_COLORS[formula.value]
+    return CONNECTIVE_COLORS[formula.top_op]
+
+
+def glyph_rings(formula: Formula) -> list[list[tuple[int, int, int]]]:
+    """
+    Get the colors of the glyph, from the outer ring to the inner ring.
+    Ring i shows the subformulas in nesting depth i, from left to right.
+    A leaf is continued in the next rings, so the segments always line up with their parent.
+    """
+    rings = []
+    level = [formula]
+    for _ in range(MAX_RINGS):
+        rings.append([node_color(node) for node in level])
+        if all(isinstance(node, (Variable, Constant)) for node in level):
+            break
+
+        next_level = []
+        for node in level:
+            if isinstance(node, BinaryOp):
+                next_level.extend((node.left, node.right))
+            elif isinstance(node, Not):
+                next_level.append(node.inner)
+            else:
+                next_level.append(node)
+        level = next_level
+    return rings
+
+
+def _center_color(formula: Formula) -> tuple[int, int, int]:
+    # formulas that only differ deeper than MAX_RINGS still get different centers
+    h = _stable_hash(formula.canonical)
+    return 60 + (h & 0xFF) * 3 // 4, 60 + ((h >> 8) & 0xFF) * 3 // 4, 60 + ((h >> 16) & 0xFF) * 3 // 4
+
+
+def _draw_wedge(surface, color, center, radius, start, end):
+    # pie segment from angle start to end (in turns, clockwise from the top)
+    steps = max(2, int((end - start) * 32))
+    points = [center]
+    for i in range(steps + 1):
+        angle = (start + (end - start) * i / steps) * 2 * math.pi
+        points.append((center[0] + radius * math.sin(angle), center[1] - radius * math.cos(angle)))
+    pygame.draw.polygon(surface, color, points)
+
+
+def draw_glyph(surface: pygame.Surface, formula: Formula, rect: pygame.Rect):
+    """Draw the glyph of the formula into rect (a square)"""
+    center = rect.center
+    outer_radius = rect.width / 2 - 1
+    rings = glyph_rings(formula)
+    # the center gets one more (smaller) ring
+    ring_width = outer_radius / (len(rings) + 1)
+
+    for i, colors in enumerate(rings):
+        radius = outer_radius - i * ring_width
+        if len(colors) == 1:
+            pygame.draw.circle(surface, colors[0], center, radius)
+        else:
+            segment = 1 / len(colors)
+            for j, color in enumerate(colors):
+                _draw_wedge(surface, color, center, radius, j * segment, (j + 1) * segment)
+
+    pygame.draw.circle(surface, _center_color(formula), center, ring_width)
+    pygame.draw.circle(surface, OUTLINE_COLOR, center, outer_radius, width=max(1, rect.width // 32))
+
+
+class ItemGlyphAtlas:
+    """
+    Procedural icons for formulas, that are too big for a text label.
+    The glyph shows the structure of the formula: the colors of the connectives in rings by nesting depth.
+
+    All glyphs are packed into one shared atlas surface, in a grid of slots (keyed by formula).
+    So drawing an item is just one blit of a sub-rect. The least recently used glyph is replaced, if the atlas is full.
+    But glyphs used in the current or the last frame are never replaced (they are needed again in the next frame).
+    Then the atlas gets more rows instead. (call begin_frame() once per frame)
+    For the current zoom, a scaled copy of the whole atlas is kept. It is only rebuilt, when the zoom bucket changes.
+    """
+    def __init__(self, columns=ATLAS_COLUMNS, glyph_size=GLYPH_SIZE):
+        self.columns = columns
+        self.rows = columns
+        self.glyph_size = glyph_size
+        self.atlas = None # created on first use
+        self.slots: OrderedDict[Formula, tuple[int, int]] = OrderedDict() # formula -> (slot index, frame of last use)
+        self.frame = 0
+
+        self.zoom_bucket = None
+        self.scaled_size = 0 # size of one glyph in the scaled atlas
+        self.scaled_atlas = None
+
+    @property
+    def capacity(self) -> int:
+        return self.columns * self.rows
+
+    def begin_frame(self):
+        self.frame += 1
+
+    def _slot_rect(self, slot: int, size: int) -> pygame.Rect:
+        return pygame.Rect((slot % self.columns) * size, (slot // self.columns) * size, size, size)
+
+    def _grow(self):
+        """Double the number of rows. The slots keep their position."""
+        old_atlas = self.atlas
+        self.rows *= 2
+        self.atlas = pygame.Surface((self.columns * self.glyph_size, self.rows * self.glyph_size), pygame.SRCALPHA)
+        self.atlas.blit(old_atlas, (0, 0))
+        self.scaled_atlas = None
+
+    def _free_slot(self) -> int:
+        if len(self.slots) < self.capacity:
+            return len(self.slots)
+
+        # the least recently used glyph is replaced, if it is not in use anymore
+        formula, (slot, last_used) = next(iter(self.slots.items()))
+        if last_used < self.frame - 1:
+            del self.slots[formula]
+            return slot
+
+        self._grow()
+        return len(self.slots)
+
+    def get_slot(self, formula: Formula) -> int:
+        """Get the slot of the formula in the atlas. The glyph is drawn, if necessary."""
+        entry = self.slots.get(formula)
+        if entry is not None:
+            self.slots[formula] = (entry[0], self.frame)
+            self.slots.move_to_end(formula)
+            return entry[0]
+
+        if self.atlas is None:
+            self.atlas = pygame.Surface((self.columns * self.glyph_size, self.rows * self.glyph_size), pygame.SRCALPHA)
+
+        slot = self._free_slot()
+        self.slots[formula] = (slot, self.frame)
+
+        rect = self._slot_rect(slot, self.glyph_size)
+        self.atlas.fill((0, 0, 0, 0), rect)
+        draw_glyph(self.atlas, formula, rect)
+
+        # keep the scaled atlas up to date, without rescaling the whole atlas
+        if self.scaled_atlas is not None:
+            scaled_rect = self._slot_rect(slot, self.scaled_size)
+            self.scaled_atlas.fill((0, 0, 0, 0), scaled_rect)
+            self.scaled_atlas.blit(
+                pygame.transform.smoothscale(self.atlas.subsurface(rect), scaled_rect.size), scaled_rect
+            )
+        return slot
+
+    def get_scaled(self, formula: Formula, zoom: float, size: float) -> tuple[pygame.Surface, pygame.Rect]:
+        """
+        Get the scaled atlas and the rect of the glyph in it.
+        size is the size of the glyph at zoom 1.0
+        """
+        zoom_bucket = max(1, round(zoom / ZOOM_BUCKET_SIZE))
+        if zoom_bucket != self.zoom_bucket:
+            self.zoom_bucket = zoom_bucket
+            self.scaled_atlas = None
+
+        slot = self.get_slot(formula)
+        if self.scaled_atlas is None:
+            self.scaled_size = max(1, round(size * zoom_bucket * ZOOM_BUCKET_SIZE))
+            self.scaled_atlas = pygame.transform.smoothscale(
+                self.atlas, (self.columns * self.scaled_size, self.rows * self.scaled_size)
+            )
+        return self.scaled_atlas, self._slot_rect(slot, self.scaled_size)
+
+    def clear(self):
+        self.slots.clear()
+        self.scaled_atlas = None
+
+
+# global instance
+item_glyph_atlas = ItemGlyphAtlas()
+
+performance_tracker.register_counter(
+    "item glyphs", lambda: f"{len(item_glyph_atlas.slots)}/{item_glyph_atlas.capacity}"
+)
@@ -0,0 +1,103 @@
+import pygame
+from collections import OrderedDict
+
+from core.formula import Formula
+from core.performance_tracker import performance_tracker
+from core.asset_manager import asset_manager
+
+# the labels are rendered 10 times bigger than needed, and get scaled down when drawing.
+LABEL_FONT_NAME = "arial"
+LABEL_FONT_SIZE = 150
+LABEL_COLOR = (0, 0, 0)
+# number of labels the cache shrinks back to. (the big labels need a lot of memory)
+# Labels used in the current or the last frame are never removed, so the cache can grow to the number of visible formulas.
+LABEL_CACHE_SIZE = 128
+# the scaled labels are cached per zoom bucket. A smaller value looks smoother while zooming, but rescales more often.
+ZOOM_BUCKET_SIZE = 0.05
+
+
+class ItemLabelCache:
+    """
+    Shared text surfaces for the item labels.
+    Thousands of items can carry the same formula, so each formula is rendered only once.
+    The least recently used labels are removed, if the cache is full. But labels that were used in the
+    current or the last frame are kept: the items are drawn in the same order every frame, so evicting them
+    would remove exactly the labels that are needed next. (call begin_frame() once per frame)
+
+    The labels that are scaled to the current zoom are cached as well. The zoom is quantized into buckets,
+    and the scaled labels are only thrown away, when the zoom bucket changes.
+    """
+    def __init__(self, max_size=LABEL_CACHE_SIZE):
+        self.max_size = max_size
+        self.labels: OrderedDict[Formula, tuple[pygame.Surface, int]] = OrderedDict() # formula -> (surface, frame of last use)
+        self.hits = 0
+        self.misses = 0
+        self.frame = 0
+
+        self.zoom_bucket = None
+        self.scaled_labels: OrderedDict[Formula, tuple[pygame.Surface, int]] = OrderedDict() # formula -> (surface for zoom_bucket, frame)
+
+    def begin_frame(self):
+        """Start a new frame. The cache shrinks back to max_size, if fewer labels are visible now."""
+        self.frame += 1
+        self._evict(self.labels)
+        self._evict(self.scaled_labels)
+
+    def _evict(self, cache: OrderedDict):
+        # the cache is in LRU order. If the oldest entry is still in use, all entries are.
+        while len(cache) > self.max_size:
+            _, last_used = cache[next(iter(cache))]
+            if last_used >= self.frame - 1:
+                break
+            cache.popitem(last=False)
+
+    def get(self, formula: Formula) -> pygame.Surface:
+        entry = self.labels.get(formula)
+        if entry is not None:
+            self.labels[formula] = (entry[0], self.frame)
+            self.labels.move_to_end(formula)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        font = asset_manager.get_font(LABEL_FONT_NAME, LABEL_FONT_SIZE, bold=True)
+        label = font.render(str(formula), True, LABEL_COLOR)
+        self.labels[formula] = (label, self.frame)
+        self._evict(self.labels)
+        return label
+
+    def get_scaled(self, formula: Formula, zoom: float) -> pygame.Surface:
+        """Get the label, scaled to the given zoom level (quantized)"""
+        zoom_bucket = max(1, round(zoom / ZOOM_BUCKET_SIZE))
+        if zoom_bucket != self.zoom_bucket:
+            self.zoom_bucket = zoom_bucket
+            self.scaled_labels.clear()
+
+        entry = self.scaled_labels.get(formula)
+        if entry is not None:
+            self.scaled_labels[formula] = (entry[0], self.frame)
+            self.scaled_labels.move_to_end(formula)
+            return entry[0]
+
+        label = self.get(formula)
+        scale = zoom_bucket * ZOOM_BUCKET_SIZE / 10
+        scaled = pygame.transform.smoothscale(
+            label,
+            (max(1, int(label.get_width() * scale)), max(1, int(label.get_height() * scale)))
+        )
+        self.scaled_labels[formula] = (scaled, self.frame)
+        self._evict(self.scaled_labels)
+        return scaled
+
+    def clear(self):
+        self.labels.clear()
+        self.scaled_labels.clear()
+
+
+# global instance
+item_label_cache = ItemLabelCache()
+
+performance_tracker.register_counter(
+    "item labels",
+    lambda: f"{item_label_cache.hits} hits, {item_label_cache.misses} misses ({len(item_label_cache.labels)}/{item_label_cache.max_size})"
+)
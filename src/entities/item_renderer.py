@@ -0,0 +1,98 @@
+import pygame
+
+from config.constants import LOD_LABEL_MIN_ZOOM, LOD_ITEM_DOT_MIN_ZOOM
+from core.utils import world_to_screen
+from entities.item import Item
+from entities.item_labels import item_label_cache
+from entities.item_glyphs import item_glyph_atlas
+
+ITEM_RADIUS = 10
+ITEM_COLOR = (240, 200, 80)
+# formulas with more nodes are drawn as glyph, because the text would not fit into the item
+GLYPH_MIN_FORMULA_SIZE = 6
+# size of the glyph in world coordinates (a bit smaller than the item, so the shape stays visible)
+GLYPH_WORLD_SIZE = 16
+
+# colors of the dots, when zoomed out: formula, theorem, theorem with assumptions
+DOT_COLORS = [ITEM_COLOR, (250, 140, 40), (240, 90, 90)]
+
+# item kinds. (the shape of the item)
+KIND_FORMULA = 0 # circle
+KIND_THEOREM = 1 # square
+KIND_THEOREM_WITH_ASSUMPTIONS = 2 # triangle
+
+# the shapes and dots are drawn once per size, and then only blitted
+_shape_surfaces: dict[tuple[int, int], pygame.Surface] = {} # (kind, radius) -> surface
+_dot_surfaces: dict[tuple[int, int], pygame.Surface] = {} # (kind, size) -> surface
+
+
+def _item_kind(item: Item) -> int:
+    if not item.key.is_theorem:
+        return KIND_FORMULA
+    return KIND_THEOREM_WITH_ASSUMPTIONS if item.key.assumption_mask else KIND_THEOREM
+
+
+def _get_shape(kind: int, radius: int) -> pygame.Surface:
+    shape = _shape_surfaces.get((kind, radius))
+    if shape is None:
+        shape = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        if kind == KIND_THEOREM:
+            pygame.draw.rect(shape, ITEM_COLOR, (0, 0, 2 * radius, 2 * radius))
+        elif kind == KIND_THEOREM_WITH_ASSUMPTIONS:
+            pygame.draw.polygon(shape, ITEM_COLOR, [(radius, 0), (0, 2 * radius), (2 * radius, 2 * radius)])
+        else:
+            pygame.draw.circle(shape, ITEM_COLOR, (radius, radius), radius)
+        _shape_surfaces[(kind, radius)] = shape
+    return shape
+
+
+def _get_dot(kind: int, size: int) -> pygame.Surface:
+    dot = _dot_surfaces.get((kind, size))
+    if dot is None:
+        dot = pygame.Surface((size, size))
+        dot.fill(DOT_COLORS[kind])
+        _dot_surfaces[(kind, size)] = dot
+    return dot
+
+
+def add_item_blits(blit_sequence: list, camera, item: Item):
+    """
+    Add the blits of the item to the sequence, for Surface.blits()
+    The item is a shape with the formula text centered.
+    Big formulas get a procedural glyph instead of the text (see item_glyphs.py)
+    When zoomed out, the text is skipped, or the item is only a dot.
+    """
+    screen_x, screen_y = world_to_screen(item.x, item.y, camera)
+    kind = _item_kind(item)
+
+    if camera.zoom < LOD_ITEM_DOT_MIN_ZOOM:
+        size = max(1, int(2 * ITEM_RADIUS * camera.zoom))
+        blit_sequence.append((_get_dot(kind, size), (screen_x - size // 2, screen_y - size // 2)))
+        return
+
+    radius = int(ITEM_RADIUS * camera.zoom)
+    blit_sequence.append((_get_shape(kind, radius), (screen_x - radius, screen_y - radius)))
+
+    if camera.zoom < LOD_LABEL_MIN_ZOOM:
+        return
+
+    formula = item.key.formula
+    if formula.size >= GLYPH_MIN_FORMULA_SIZE:
+        atlas, area = item_glyph_atlas.get_scaled(formula, camera.zoom, GLYPH_WORLD_SIZE)
+        blit_sequence.append((atlas, (screen_x - area.width // 2, screen_y - area.height // 2), area))
+        return
+
+    # the text is rendered and scaled only once per formula (and zoom level), and shared by all items
+    scaled_text = item_label_cache.get_scaled(formula, camera.zoom)
+    blit_sequence.append((scaled_text, scaled_text.get_rect(center=(screen_x, screen_y))))
+
+
+def draw_items(screen, camera, items):
+    """Draw all items with one blits() call"""
+    item_label_cache.begin_frame()
+    item_glyph_atlas.begin_frame()
+    blit_sequence = []
+    for item in items:
+        add_item_blits(blit_sequence, camera, item)
+    screen.blits(blit_sequence, doreturn=False)
+
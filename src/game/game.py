@@ -16,15 +16,28 @@ from gui.menu.pause_menu import PauseMenu
 from config.settings_manager import settings_manager
 from core.performance_tracker import performance_tracker
 from machines.types.hub import Hub
+from machines.types.conveyor_belt.belt_sprites import belt_sprites
 
 from entities.item import Item
+from entities.item_labels import LABEL_FONT_NAME, LABEL_FONT_SIZE
 from core.formula_parser import parse_formula
+from core.asset_manager import asset_manager
+
+# fonts as (name, size, bold). The debug overlay is needed in the first frame.
+FIRST_FRAME_FONTS = [(None, 16, False)]
+# the menus and item labels, loaded during the first frames. The system font ("arial") is the slowest, so it comes last.
+QUEUED_FONTS = [
+    (None, 20, False), (None, 22, False), (None, 24, False), (None, 24, True), (None, 28, False),
+    (None, 36, False), (None, 72, False),
+    (LABEL_FONT_NAME, LABEL_FONT_SIZE, True),
+]
 
 class Game:
     """Main game class that coordinates all systems"""
     
     def __init__(self):
         self._initialize_pygame()
+        self._initialize_assets()
         self._initialize_core_systems()
         self._initialize_game_systems()
         self._initialize_gui()
@@ -41,6 +54,11 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
         
+    def _initialize_assets(self):
+        """Load the fonts of the first frame now, and the others during the next frames"""
+        asset_manager.preload(fonts=FIRST_FRAME_FONTS)
+        asset_manager.queue(fonts=QUEUED_FONTS)
+        
     def _initialize_core_systems(self):
         """Initialize core game systems"""
         self.input_handler = InputHandler()
@@ -53,9 +71,10 @@ class Game:
         self.grid = GridCoordinator()
         self.game_state = GameStateManager()
         
-        # Load machine images
+        # Load machine images (through the asset manager)
         for machine in machine_data.machines.values():
             machine.load_image()
+        belt_sprites.load()
             
     def _initialize_gui(self):
         """Initialize GUI components"""
@@ -83,8 +102,8 @@ class Game:
 
         # add some test-items
         formula1 = parse_formula("(a*b)+c")
-        formula2 = parse_formula("d->(e+f)")
-        formula3 = parse_formula("i->j")
+        formula2 = parse_formula("d->c")
+        formula3 = parse_formula("d")
         assumptions = frozenset([formula2, formula3])
         item = Item(formula1, is_theorem=True, assumptions=assumptions)
         hub.add(item, 10)
@@ -137,7 +156,7 @@ class Game:
         gui_components = []
         match self.game_state.current_state:
             case GameState.PLAYING:
-                gui_components = [self.placement_preview, self.machine_selection_bar]
+                gui_components = [self.input_processor.current_tool, self.placement_preview, self.machine_selection_bar]
             case GameState.MENU_OPEN:
                 gui_components = [self.game_state.active_menu, self.machine_selection_bar]
             case GameState.PAUSED:
@@ -179,6 +198,9 @@ class Game:
             self.update(dt)
             performance_tracker.end("update.total")
             
+            # load a few of the remaining assets
+            asset_manager.load_queued()
+
             # Render frame
             performance_tracker.start("render.total")
             self.render()
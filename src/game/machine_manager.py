@@ -77,6 +77,12 @@ class MachineManager:
         """Remove machine at current mouse position"""
         grid_x, grid_y = get_mouse_grid_pos(self.camera)
         self.grid.remove_block(grid_x, grid_y)
+
+    def remove_machines_in_area(self, start_tile, end_tile):
+        """Remove all machines in the rectangle between two tiles (e.g. dragged with the eraser)"""
+        min_x, max_x = sorted((start_tile[0], end_tile[0]))
+        min_y, max_y = sorted((start_tile[1], end_tile[1]))
+        self.grid.remove_blocks_in_rect(min_x, max_x, min_y, max_y)
         
     def create_menu_for_machine_at_mouse(self, screen):
         """Create appropriate menu for machine at mouse position"""
@@ -125,7 +131,7 @@ class MachineManager:
         self.grid.connection_system.update_neighboring_belts_when_removing(machine)
 
         # rotate the machine
-        machine.rotate(1)
+        self.grid.rotate_block(machine, 1)
         machine.clear_ports()
         machine.init_ports()
         machine.rotate_ports()
@@ -1,20 +1,69 @@
+import pygame
 from game.tools.abstract_tool import AbstractTool
+from config.constants import TILE_SIZE
+from core.utils import get_mouse_grid_pos, grid_to_screen_coordinates
+
+AREA_COLOR = (255, 50, 50)
 
 class EraserTool(AbstractTool):
+    """
+    Deletes the machine under the mouse (hold the left mouse button to keep deleting).
+    With ctrl held, dragging a rectangle deletes all machines in it, when the mouse button is released.
+    """
     def __init__(self, machine_manager, placement_preview, machine_selection_bar, game_state):
         super().__init__(machine_manager, placement_preview, machine_selection_bar, game_state)
         self.is_deleting = False
 
+        # drag-rectangle mode: the first and the current tile of the rectangle
+        self.area_start = None
+        self.area_end = None
+
     def handle_inputs(self, input_handler, screen):
         # left click
         if input_handler.was_mouse_pressed(1):
-            # delete machine
-            self.machine_manager.remove_machine_at_mouse()
-            self.is_deleting = True
+            if input_handler.is_key_held(pygame.K_LCTRL) or input_handler.is_key_held(pygame.K_RCTRL):
+                # start the rectangle
+                self.area_start = get_mouse_grid_pos(self.machine_manager.camera)
+                self.area_end = self.area_start
+            else:
+                # delete machine
+                self.machine_manager.remove_machine_at_mouse()
+                self.is_deleting = True
 
     def update(self, input_handler):
+        if self.area_start is not None:
+            if input_handler.is_key_held("mouse_1"):
+                self.area_end = get_mouse_grid_pos(self.machine_manager.camera)
+                return
+
+            # mouse button released: delete everything in the rectangle at once.
+            # (if the tool was switched while dragging, the rectangle is dropped)
+            if input_handler.was_mouse_released(1):
+                self.machine_manager.remove_machines_in_area(self.area_start, self.area_end)
+            self.area_start = None
+            self.area_end = None
+            return
+
         # hold left mouse button for deleting
         if self.is_deleting and input_handler.is_key_held("mouse_1"):
             self.machine_manager.remove_machine_at_mouse()
         else:
             self.is_deleting = False
+
+    def draw(self):
+        """Draw the rectangle, while it is dragged"""
+        if self.area_start is None:
+            return
+
+        camera = self.machine_manager.camera
+        min_x, max_x = sorted((self.area_start[0], self.area_end[0]))
+        min_y, max_y = sorted((self.area_start[1], self.area_end[1]))
+        screen_x, screen_y = grid_to_screen_coordinates(min_x, min_y, camera)
+        width = (max_x - min_x + 1) * TILE_SIZE * camera.zoom
+        height = (max_y - min_y + 1) * TILE_SIZE * camera.zoom
+
+        overlay = pygame.Surface((int(width), int(height)), pygame.SRCALPHA)
+        overlay.fill((*AREA_COLOR, 60))
+        screen = pygame.display.get_surface()
+        screen.blit(overlay, (screen_x, screen_y))
+        pygame.draw.rect(screen, AREA_COLOR, (screen_x, screen_y, width, height), 2)
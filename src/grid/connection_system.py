@@ -1,3 +1,4 @@
+from typing import Dict, List
 from machines.types.conveyor_belt.conveyor_belt import ConveyorBelt
 from machines.types.conveyor_belt.belt_autoconnect import ConveyorBeltAutoConnector
 from machines.base.machine import Machine
@@ -8,6 +9,29 @@ class ConnectionSystem:
     def __init__(self, grid_manager):
         self.grid_manager = grid_manager
 
+        # belts, whose sprite is updated later (see defer_sprite_updates). None, if the sprites are updated immediately
+        self.pending_sprites: Dict[int, ConveyorBelt] | None = None
+
+    def defer_sprite_updates(self):
+        """
+        Collect the sprite updates, instead of doing them immediately. When placing many blocks, the same
+        neighbor belts are reconfigured many times, but only their last sprite is visible.
+        """
+        self.pending_sprites = {}
+
+    def flush_sprite_updates(self):
+        """Update the sprites of all belts collected since defer_sprite_updates(), once per belt"""
+        belts = self.pending_sprites or {}
+        self.pending_sprites = None
+        for belt in belts.values():
+            ConveyorBeltAutoConnector.update_sprite(belt)
+
+    def update_sprite(self, belt: ConveyorBelt):
+        if self.pending_sprites is not None:
+            self.pending_sprites[id(belt)] = belt
+        else:
+            ConveyorBeltAutoConnector.update_sprite(belt)
+
     def update_connections_at(self, grid_x: int, grid_y: int):
         """Re-evaluate connections for the block at (x, y) and its neighbors"""
         block = self.grid_manager.get_block(grid_x, grid_y)
@@ -47,7 +71,25 @@ class ConnectionSystem:
                 self.update_connections_at(neighbor.origin[0], neighbor.origin[1])
         
         # 4) update the sprite of the conveyor belt
-        ConveyorBeltAutoConnector.update_sprite(conveyor)
+        self.update_sprite(conveyor)
+
+
+    def connect_placed_blocks(self, blocks: List[Machine]):
+        """
+        Resolve the ports of many blocks, that were inserted into the grid at once with their final inputs and
+        outputs (see GridCoordinator.begin_batch). Every block is connected once, and the belts around the
+        blocks, that were there before, are configured once per placed neighbor.
+        """
+        placed = set(blocks)
+        for block in blocks:
+            self.update_connections_at(block.origin[0], block.origin[1])
+            if isinstance(block, ConveyorBelt):
+                self.update_sprite(block)
+
+            for direction, neighbors in self.grid_manager.get_neighboring_machines_of(block).items():
+                for neighbor in neighbors:
+                    if isinstance(neighbor, ConveyorBelt) and neighbor not in placed:
+                        ConveyorBeltAutoConnector.configure_neighbor_when_placing(neighbor, direction, block, self)
 
 
     def update_neighboring_belts_when_placing(self, machine: Machine):
@@ -69,3 +111,28 @@ class ConnectionSystem:
                     ConveyorBeltAutoConnector.configure_neighbor_when_removing(neighbor, direction, machine, self)
                     self.update_connections_at(neighbor.origin[0], neighbor.origin[1])
     
+
+
+    def prepare_removing_blocks(self, blocks: List[Machine]) -> List[ConveyorBelt]:
+        """
+        Prepare removing many blocks at once. Call this before the blocks are removed from the grid.
+        The belts around the blocks forget their inputs and outputs to the blocks. Returns these belts,
+        so they can be configured once with update_belts_after_removing(), instead of once per removed neighbor.
+        """
+        removed_machines = set(blocks)
+        border_belts = {}
+        for block in blocks:
+            for neighbors in self.grid_manager.get_neighboring_machines_of(block).values():
+                for neighbor in neighbors:
+                    if isinstance(neighbor, ConveyorBelt) and neighbor not in removed_machines:
+                        border_belts[neighbor.origin] = neighbor
+
+        for belt in border_belts.values():
+            ConveyorBeltAutoConnector.remove_io_to(belt, removed_machines)
+        return list(border_belts.values())
+
+
+    def update_belts_after_removing(self, belts: List[ConveyorBelt]):
+        """Configure the belts returned by prepare_removing_blocks(), after the blocks are removed"""
+        for belt in belts:
+            ConveyorBeltAutoConnector.configure_after_removing(belt, self)
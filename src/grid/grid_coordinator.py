@@ -1,4 +1,4 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 from grid.grid_manager import GridManager
 from grid.update_system import UpdateSystem
 from grid.grid_renderer import GridRenderer
@@ -19,9 +19,17 @@ class GridCoordinator:
         self.item_transfer_system = ItemTransferSystem(self.grid_manager)
         self.update_system = UpdateSystem(self.grid_manager, self.item_transfer_system)
         self.renderer = GridRenderer(self.grid_manager)
+
+        # the open batch (see begin_batch). None, if there is no batch
+        self._batch_blocks: List[Machine] | None = None # inserted into the grid, but not connected yet
+        self._batch_pending: List[Tuple[int, int, Machine]] | None = None # placed one by one in commit()
     
     # Delegate common operations to grid_manager
     def add_block(self, grid_x: int, grid_y: int, block):
+        if self._batch_blocks is not None:
+            self._add_block_to_batch(grid_x, grid_y, block)
+            return
+
         self.grid_manager.add_block(grid_x, grid_y, block)
 
         # update connections for the newly placed block
@@ -36,6 +44,43 @@ class GridCoordinator:
             self.connection_system.update_neighboring_belts_when_placing(block)
         
     
+    def begin_batch(self):
+        """
+        Start placing many blocks at once (e.g. loading a save). The blocks are inserted into the grid
+        immediately, and their ports and sprites are resolved in one pass in commit().
+        Belts without inputs and outputs (new belts, old saves) get them from their neighbors, and this depends on
+        the placement order. So these belts, and all blocks after them, are placed one by one in commit().
+        """
+        if self._batch_blocks is not None:
+            raise ValueError("A batch is already open")
+        self._batch_blocks = []
+        self._batch_pending = []
+
+    def _add_block_to_batch(self, grid_x: int, grid_y: int, block):
+        needs_neighbors = isinstance(block, ConveyorBelt) and not block.inputs
+        if self._batch_pending or needs_neighbors:
+            self._batch_pending.append((grid_x, grid_y, block))
+        else:
+            self.grid_manager.add_block(grid_x, grid_y, block)
+            self._batch_blocks.append(block)
+
+    def commit(self):
+        """Finish the batch started with begin_batch()"""
+        if self._batch_blocks is None:
+            raise ValueError("No batch is open")
+        blocks, pending = self._batch_blocks, self._batch_pending
+        self._batch_blocks = None
+        self._batch_pending = None
+
+        # the sprites of the belts are updated once per belt, at the end
+        self.connection_system.defer_sprite_updates()
+        try:
+            self.connection_system.connect_placed_blocks(blocks)
+            for grid_x, grid_y, block in pending:
+                self.add_block(grid_x, grid_y, block)
+        finally:
+            self.connection_system.flush_sprite_updates()
+    
     def remove_block(self, grid_x: int, grid_y: int):
         # Update connections before removing the block
         block = self.grid_manager.get_block(grid_x, grid_y)
@@ -43,8 +88,24 @@ class GridCoordinator:
             self.connection_system.update_neighboring_belts_when_removing(block)
         return self.grid_manager.remove_block(grid_x, grid_y)
     
+    def remove_blocks_in_rect(self, min_x: int, max_x: int, min_y: int, max_y: int) -> List[Machine]:
+        """
+        Remove all blocks that overlap the rectangle of tiles (the bounds are inclusive). The hub is not removed.
+        Only the surviving belts around the area are reconfigured, once each.
+        """
+        blocks = [block for block in self.grid_manager.blocks_in_rect(min_x, max_x, min_y, max_y) if not isinstance(block, Hub)]
+
+        border_belts = self.connection_system.prepare_removing_blocks(blocks)
+        for block in blocks:
+            self.grid_manager.remove_block(block.origin[0], block.origin[1])
+        self.connection_system.update_belts_after_removing(border_belts)
+        return blocks
+    
     def get_block(self, grid_x: int, grid_y: int):
         return self.grid_manager.get_block(grid_x, grid_y)
+
+    def rotate_block(self, block: Machine, n=1):
+        self.grid_manager.rotate_block(block, n)
     
     def get_blocks_at_area(self, grid_x: int, grid_y: int, size: tuple[int, int]) -> Dict[Tuple[int, int], Machine]:
         return self.grid_manager.get_blocks_at_area(grid_x, grid_y, size)
@@ -86,7 +147,11 @@ class GridCoordinator:
         #coordinator = cls()
         this.grid_manager.reset()
 
-        for machine_data in data.get("machines", []):
-            machine = MachineFactory.from_data(machine_data, machine_database)
-            origin_x, origin_y = machine.origin
-            this.add_block(origin_x, origin_y, machine) # like this, also the ports get connected
+        this.begin_batch()
+        try:
+            for machine_data in data.get("machines", []):
+                machine = MachineFactory.from_data(machine_data, machine_database)
+                origin_x, origin_y = machine.origin
+                this.add_block(origin_x, origin_y, machine) # like this, also the ports get connected
+        finally:
+            this.commit()
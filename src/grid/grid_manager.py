@@ -1,7 +1,13 @@
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, List
 from machines.base.machine import Machine
 from entities.port import Direction
 from machines.types.hub import Hub
+from machines.types.conveyor_belt.conveyor_belt import ConveyorBelt
+from machines.types.conveyor_belt.output_belt import OutputBelt
+from grid.interfaces import IUpdatable, IProvider
+
+# the spatial index splits the grid into chunks of CHUNK_SIZE x CHUNK_SIZE tiles
+CHUNK_SIZE = 16
 
 class GridManager:
     """Manages the placement and removal of blocks on the grid"""
@@ -9,6 +15,44 @@ class GridManager:
     def __init__(self):
         self.blocks: Dict[Tuple[int, int], Machine] = {}
         self.occupied_tiles: Dict[Tuple[int, int], Machine] = {}
+        # spatial index: chunk -> {origin: block} of all blocks that overlap the chunk
+        self.chunks: Dict[Tuple[int, int], Dict[Tuple[int, int], Machine]] = {}
+
+        # blocks by role, so the systems don't have to check the type of every block. (origin -> block)
+        self.updatables: Dict[Tuple[int, int], Machine] = {}
+        self.providers: Dict[Tuple[int, int], Machine] = {}
+        self.output_belts: Dict[Tuple[int, int], OutputBelt] = {} # only the active ones (outputs of the hub)
+        self.belts: Dict[Tuple[int, int], ConveyorBelt] = {}
+        self.machines: Dict[Tuple[int, int], Machine] = {} # all blocks, that are not conveyor belts
+
+    def _register_roles(self, block: Machine):
+        origin = block.origin
+        if isinstance(block, IUpdatable):
+            self.updatables[origin] = block
+        if isinstance(block, IProvider):
+            self.providers[origin] = block
+        if isinstance(block, OutputBelt) and block.is_active:
+            self.output_belts[origin] = block
+        if isinstance(block, ConveyorBelt):
+            self.belts[origin] = block
+        else:
+            self.machines[origin] = block
+
+    def _unregister_roles(self, block: Machine):
+        origin = block.origin
+        for role in (self.updatables, self.providers, self.output_belts, self.belts, self.machines):
+            role.pop(origin, None)
+
+    def _chunks_of(self, block: Machine):
+        """
+        All chunks, that the block can overlap.
+        We use a square of the larger side, so the index stays correct when the block gets rotated.
+        """
+        origin_x, origin_y = block.origin
+        extent = max(block.size) - 1
+        for chunk_x in range(origin_x // CHUNK_SIZE, (origin_x + extent) // CHUNK_SIZE + 1):
+            for chunk_y in range(origin_y // CHUNK_SIZE, (origin_y + extent) // CHUNK_SIZE + 1):
+                yield chunk_x, chunk_y
     
     def add_block(self, grid_x: int, grid_y: int, block: Machine):
         """Add a block to the grid"""
@@ -19,6 +63,10 @@ class GridManager:
         for x in range(grid_x, grid_x + block.size[0]):
             for y in range(grid_y, grid_y + block.size[1]):
                 self.occupied_tiles[(x, y)] = block
+
+        for chunk in self._chunks_of(block):
+            self.chunks.setdefault(chunk, {})[block.origin] = block
+        self._register_roles(block)
         
     def remove_block(self, grid_x: int, grid_y: int) -> Optional[Machine]:
         """Remove block at position"""
@@ -37,12 +85,48 @@ class GridManager:
         for x in range(origin_x, origin_x + block.size[0]):
             for y in range(origin_y, origin_y + block.size[1]):
                 del self.occupied_tiles[(x, y)]
+
+        for chunk in self._chunks_of(block):
+            chunk_blocks = self.chunks[chunk]
+            del chunk_blocks[block.origin]
+            if not chunk_blocks:
+                del self.chunks[chunk]
+        self._unregister_roles(block)
         return block
+
+    def rotate_block(self, block: Machine, n=1):
+        """Rotate the block by n * 90°. The roles can change (e.g. an output belt of the hub)"""
+        self._unregister_roles(block)
+        block.rotate(n)
+        self._register_roles(block)
     
     def get_block(self, grid_x: int, grid_y: int) -> Optional[Machine]:
         """Get block at position"""
         return self.occupied_tiles.get((grid_x, grid_y))
     
+    def blocks_in_rect(self, min_x: int, max_x: int, min_y: int, max_y: int, role=None) -> List[Machine]:
+        """
+        Get all blocks that overlap the rectangle of tiles (the bounds are inclusive). Only the chunks in the rectangle are visited.
+        role can be one of the role dicts (like self.belts), to get only these blocks.
+        """
+        blocks: Dict[Tuple[int, int], Machine] = {}
+        for chunk_x in range(min_x // CHUNK_SIZE, max_x // CHUNK_SIZE + 1):
+            for chunk_y in range(min_y // CHUNK_SIZE, max_y // CHUNK_SIZE + 1):
+                chunk_blocks = self.chunks.get((chunk_x, chunk_y))
+                if not chunk_blocks:
+                    continue
+
+                for origin, block in chunk_blocks.items():
+                    if origin in blocks:
+                        continue # the block is in multiple chunks
+                    if role is not None and origin not in role:
+                        continue
+                    origin_x, origin_y = origin
+                    width, height = block.size
+                    if origin_x + width > min_x and origin_x <= max_x and origin_y + height > min_y and origin_y <= max_y:
+                        blocks[origin] = block
+        return list(blocks.values())
+
     def get_blocks_at_area(self, grid_x: int, grid_y: int, size: Tuple[int, int]) -> Dict[Tuple[int, int], Machine]:
         """Get all blocks in a specified area"""
         blocks = {}
@@ -117,6 +201,9 @@ class GridManager:
         """Remove all machines and clear the grid."""
         self.blocks.clear()
         self.occupied_tiles.clear()
+        self.chunks.clear()
+        for role in (self.updatables, self.providers, self.output_belts, self.belts, self.machines):
+            role.clear()
 
 
     # save the machines of the grid to a json file
@@ -2,8 +2,9 @@ import pygame
 import math
 import time
 from config.constants import TILE_SIZE, GRID_LINE_COLOR
-from machines.types.conveyor_belt.conveyor_belt import ConveyorBelt
+from config.settings_manager import settings_manager
 from core.utils import get_mouse_grid_pos, grid_to_screen_coordinates
+from entities.item_renderer import draw_items
 
 class GridRenderer:
     """Handles rendering of the grid and its contents"""
@@ -12,42 +13,47 @@ class GridRenderer:
         self.grid_manager = grid_manager
     
     def draw_grid_lines(self, screen, camera):
-        """Draw the grid lines"""
-        screen_width, screen_height = screen.get_size()
-        start_x = int(-(camera.offset_x % TILE_SIZE) * camera.zoom)
-        start_y = int(-(camera.offset_y % TILE_SIZE) * camera.zoom)
-        
+        """Draw the grid lines (one line per tile border within the view of the current frame)"""
+        left, right, top, bottom = camera.get_visible_tile_bounds()
+        _, _, view_width, view_height = camera.view_rect
+        line_width = int(view_width * camera.zoom)
+        line_height = int(view_height * camera.zoom)
+
         # Vertical lines
-        x = start_x
-        while x < screen_width:
-            pygame.draw.line(screen, GRID_LINE_COLOR, (int(x), 0), (int(x), screen_height))
-            x += TILE_SIZE * camera.zoom
-        
+        for grid_x in range(left, right):
+            x, _ = grid_to_screen_coordinates(grid_x, 0, camera)
+            pygame.draw.line(screen, GRID_LINE_COLOR, (int(x), 0), (int(x), line_height))
+
         # Horizontal lines
-        y = start_y
-        while y < screen_height:
-            pygame.draw.line(screen, GRID_LINE_COLOR, (0, int(y)), (screen_width, int(y)))
-            y += TILE_SIZE * camera.zoom
+        for grid_y in range(top, bottom):
+            _, y = grid_to_screen_coordinates(0, grid_y, camera)
+            pygame.draw.line(screen, GRID_LINE_COLOR, (0, int(y)), (line_width, int(y)))
     
-    def _block_is_visible(self, block, camera) -> bool:
-        """Check if the block is within the visible bounds of the camera"""
+    def _visible_blocks(self, camera, role):
+        """Get the blocks of the role within the visible bounds of the camera. (only the visible chunks of the grid are searched)"""
         min_x, max_x, min_y, max_y = camera.get_visible_tile_bounds()
-        tile_x, tile_y = block.origin
-        w, h = block.size
-        
-        return not (tile_x + w < min_x or tile_x > max_x or tile_y + h < min_y or tile_y > max_y)
+        return self.grid_manager.blocks_in_rect(min_x, max_x, min_y, max_y, role)
 
 
     def draw_machines(self, screen, camera):
         """Draw all blocks on the grid, that are not conveyor belts"""
-        for (tile_x, tile_y), block in self.grid_manager.blocks.items():
-            # Check if block is within visible bounds
-            if not self._block_is_visible(block, camera):
-                continue
-
-            # Draw the block
-            if not isinstance(block, ConveyorBelt):
-                block.draw(screen, camera)
+        machines = self._visible_blocks(camera, self.grid_manager.machines)
+
+        # the layers are drawn one after another. All sprites are drawn with one blits() call
+        for machine in machines:
+            machine.draw_underlay(screen, camera)
+
+        blit_sequence = []
+        for machine in machines:
+            sprite_blit = machine.get_sprite_blit(camera)
+            if sprite_blit:
+                blit_sequence.append(sprite_blit)
+            else:
+                machine.draw_sprite(screen, camera)
+        screen.blits(blit_sequence, doreturn=False)
+
+        for machine in machines:
+            machine.draw_overlay(screen, camera)
     
 
     def draw_highlight(self, screen, camera, active_tool, grid_manager):
@@ -99,25 +105,28 @@ class GridRenderer:
 
     def draw_items(self, screen, camera):
         """Draw all items on the grid"""
-        for block in self.grid_manager.blocks.values():
-            # Check if block is within visible bounds
-            if not self._block_is_visible(block, camera):
-                continue
-            
-            # Draw items on the conveyor belt
-            if isinstance(block, ConveyorBelt):
-                if block.item:
-                    block.item.draw(screen, camera)
+        # the items are collected, and drawn with one blits() call
+        items = [belt.item for belt in self._visible_blocks(camera, self.grid_manager.belts) if belt.item]
+
+        draw_items(screen, camera, items)
     
 
     def draw_conveyor_belts(self, screen, camera):
         """Draw all conveyor belts on the grid"""
-        for (tile_x, tile_y), block in self.grid_manager.blocks.items():
-            # Check if block is within visible bounds
-            if not self._block_is_visible(block, camera):
-                continue
-            
-            # Draw the conveyor belt
-            if isinstance(block, ConveyorBelt):
-                block.draw(screen, camera)
+        belts = self._visible_blocks(camera, self.grid_manager.belts)
+
+        # all belt sprites are drawn with one blits() call
+        blit_sequence = []
+        for belt in belts:
+            sprite_blit = belt.get_sprite_blit(camera)
+            if sprite_blit:
+                blit_sequence.append(sprite_blit)
+            else:
+                belt.draw_sprite(screen, camera)
+        screen.blits(blit_sequence, doreturn=False)
+
+        # belts have no overlay, except the ports
+        if settings_manager.get("debug.show_ports"):
+            for belt in belts:
+                belt.draw_ports(screen, camera)
     
\ No newline at end of file
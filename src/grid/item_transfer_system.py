@@ -1,6 +1,5 @@
 from entities.item import Item
 from entities.port import Port
-from machines.types.conveyor_belt.output_belt import OutputBelt
 from machines.types.hub import Hub
 
 class ItemTransferSystem:
@@ -15,27 +14,26 @@ class ItemTransferSystem:
         # pending system?
 
     def _process_all_ports(self):
-        """Scan grid and handle transfers from all output ports"""
-        for block in self.grid_manager.blocks.values():
-            if not hasattr(block, "output_ports"):
+        """Handle transfers from all output ports"""
+        # handle the connections from the hub to an OutputBelt
+        for block in self.grid_manager.output_belts.values():
+            if block.item:
                 continue
-            
-            # handle the connections from the hub to an OutputBelt
-            if isinstance(block, OutputBelt) and block.is_active and not block.item:
-                filter = block.output_filter
-                for input_port in block.input_ports:
-                    connected_port = input_port.connected_port
-                    if connected_port and isinstance(connected_port.machine, Hub):
-                        item = connected_port.machine.provide_item_using_filter(connected_port, filter)
 
-                        if not item:
-                            continue
+            filter = block.output_filter
+            for input_port in block.input_ports:
+                connected_port = input_port.connected_port
+                if connected_port and isinstance(connected_port.machine, Hub):
+                    item = connected_port.machine.provide_item_using_filter(connected_port, filter)
 
-                        if not input_port.receive_item(item):
-                            self._handle_backpressure(connected_port, item)
+                    if not item:
+                        continue
 
-            
-            # every other connection
+                    if not input_port.receive_item(item):
+                        self._handle_backpressure(connected_port, item)
+
+        # every other connection
+        for block in self.grid_manager.providers.values():
             for output_port in block.output_ports:
                 # Try to get an item from this output port
                 item = output_port.provide_item()
@@ -1,4 +1,3 @@
-from grid.interfaces import IUpdatable
 from core.performance_tracker import performance_tracker
 
 class UpdateSystem:
@@ -12,10 +11,8 @@ class UpdateSystem:
         """Update all systems"""
         # Update all updatable blocks
         performance_tracker.start("update.blocks")
-        for block in self.grid_manager.blocks.values():
-            if isinstance(block, IUpdatable):
-                # Call update method if block implements IUpdatable
-                block.update(dt)
+        for block in self.grid_manager.updatables.values():
+            block.update(dt)
         performance_tracker.end("update.blocks")
         
         # Update item transfer system
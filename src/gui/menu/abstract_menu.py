@@ -1,4 +1,5 @@
 import pygame
+from core.asset_manager import asset_manager
 
 class AbstractMenu:
     def __init__(self, screen, width=800, height=600, on_back=None, title="MENU"):
@@ -6,8 +7,8 @@ class AbstractMenu:
         self.width = width
         self.height = height
         self.on_back = on_back
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
+        self.font = asset_manager.get_font(None, 36)
+        self.title_font = asset_manager.get_font(None, 72)
         self.is_open = False
         self.opened_this_frame = False # flank for is_open
 
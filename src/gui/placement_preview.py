@@ -51,7 +51,7 @@ class PlacementPreview():
             # right now, we don't update the sprites of the neighbors. But this would also be an option.
 
         else:
-            dummy.rotate_image(self.rotation)
+            dummy.update_image()
             
         return dummy
 
@@ -2,6 +2,7 @@ from grid.interfaces import IProvider, IReceiver, IUpdatable
 from machines.base.machine import Machine
 from config.constants import TILE_SIZE
 from entities.item import Item
+from entities.item_renderer import draw_items
 
 
 class LogicMachine(Machine, IUpdatable, IReceiver, IProvider):
@@ -26,13 +27,13 @@ class LogicMachine(Machine, IUpdatable, IReceiver, IProvider):
         move_speed = 0.5
         dir = (direction + 2) % 4
         if dir == 0:
-            item.position.x += move_speed
+            item.x += move_speed
         elif dir == 1:
-            item.position.y += move_speed
+            item.y += move_speed
         elif dir == 2:
-            item.position.x -= move_speed
+            item.x -= move_speed
         else:
-            item.position.y -= move_speed
+            item.y -= move_speed
     
 
     def _reset_inputs(self):
@@ -79,11 +80,9 @@ class LogicMachine(Machine, IUpdatable, IReceiver, IProvider):
         else:
             print(f"Warning: {self.__class__.__name__} already has an output item, ignoring new item.")
 
-    def draw(self, screen, camera):
-        for item in self.input_items:
-            if item:
-                item.draw(screen, camera)
-        super().draw(screen, camera)
+    def draw_underlay(self, screen, camera):
+        # the input items slide in below the machine
+        draw_items(screen, camera, [item for item in self.input_items if item])
 
     # functions that each specific machine must implement
     def _ready_to_process(self) -> bool:
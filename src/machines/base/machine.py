@@ -3,7 +3,7 @@ from typing import List
 
 from entities.port import Port
 from core.utils import world_to_screen
-from config.constants import TILE_SIZE
+from config.constants import TILE_SIZE, LOD_MACHINE_SPRITE_MIN_ZOOM
 from config.settings_manager import settings_manager
 
 class Machine:
@@ -12,10 +12,9 @@ class Machine:
 
         self.size = machine_data.size # size in grid tiles. Can be changed by rotation
         self.color = (200, 200, 200)
-        self.image = machine_data.image
         self.rotation = rotation
         self.update_rotated_size(rotation)
-        self.rotate_image(rotation)
+        self.update_image()
         self.origin = origin
 
         # port system
@@ -58,7 +57,7 @@ class Machine:
         self.rotation = (self.rotation + n) % 4
         self.update_rotated_size(n)
         self.rotate_ports()
-        self.rotate_image(n)
+        self.update_image()
 
     def rotate_ports(self):
         for port in self.ports:
@@ -86,10 +85,13 @@ class Machine:
         if n % 2 == 1:
             self.size = (self.size[1], self.size[0])
 
-    def rotate_image(self, n):
-        """rotate the current image by n * 90°"""
-        if self.image:
-            self.image = pygame.transform.rotate(self.image, -90 * n)
+    def update_image(self):
+        """Use the image for the current rotation. The images are rotated only once in MachineData."""
+        self.image = self.data.get_image(self.rotation)
+
+    def get_scaled_image(self, size: tuple[int, int], smooth=False):
+        """Get the image scaled to size (in pixels), from the shared sprite cache"""
+        return self.data.get_scaled_image(self.rotation, size, smooth)
 
     def get_info_text(self) -> str:
         return self.data.description
@@ -98,31 +100,55 @@ class Machine:
         pass
 
     
-    def draw(self, screen, camera):
+    def get_sprite_blit(self, camera):
+        """
+        Get (surface, screen position) of the machine sprite, or None if there is no image.
+        The renderer collects these, and blits all sprites of a layer with one call.
+        """
+        if not self.image:
+            return None
+
         screen_x, screen_y = world_to_screen(self.origin[0] * TILE_SIZE, self.origin[1] * TILE_SIZE, camera)
 
         # Scale the size based on TILE_SIZE and camera zoom (+1 to avoid gaps)
         scaled_width = int(self.size[0] * TILE_SIZE * camera.zoom) + 1
         scaled_height = int(self.size[1] * TILE_SIZE * camera.zoom) + 1
 
-        # draw the image of the machine, if it exists
-        if self.image:
-            scaled_image = pygame.transform.scale(
-                self.image, 
-                (scaled_width, scaled_height)
-            )
-            screen.blit(scaled_image, (screen_x, screen_y))
-        
+        # when zoomed out, the sprites are shrunk with smoothscale. That looks better, and is cached anyway
+        smooth = camera.zoom < LOD_MACHINE_SPRITE_MIN_ZOOM
+        return self.get_scaled_image((scaled_width, scaled_height), smooth), (screen_x, screen_y)
+
+    def draw_underlay(self, screen, camera):
+        """Hook for things that are drawn below the machine sprite"""
+        pass
+
+    def draw_sprite(self, screen, camera):
+        sprite_blit = self.get_sprite_blit(camera)
+        if sprite_blit:
+            screen.blit(*sprite_blit)
+
         # otherwise draw a rectangle
         else:
+            screen_x, screen_y = world_to_screen(self.origin[0] * TILE_SIZE, self.origin[1] * TILE_SIZE, camera)
             pygame.draw.rect(
                 screen, 
                 self.color, 
-                pygame.Rect(screen_x, screen_y, scaled_width, scaled_height)
+                pygame.Rect(
+                    screen_x, screen_y,
+                    int(self.size[0] * TILE_SIZE * camera.zoom) + 1, int(self.size[1] * TILE_SIZE * camera.zoom) + 1
+                )
             )
+
+    def draw_overlay(self, screen, camera):
+        """Things that are drawn above the machine sprite"""
         # Draw ports for debugging
         if settings_manager.get("debug.show_ports"):
             self.draw_ports(screen, camera)
+
+    def draw(self, screen, camera):
+        self.draw_underlay(screen, camera)
+        self.draw_sprite(screen, camera)
+        self.draw_overlay(screen, camera)
     
 
     def draw_ports(self, screen, camera):
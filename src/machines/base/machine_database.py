@@ -15,6 +15,8 @@ from machines.types.false_introduction import FalseIntroduction
 from machines.types.or_elimination import OrElimination
 from machines.types.double_not_elimination import DoubleNotElimination
 from machines.types.hub import Hub
+from machines.base.sprite_cache import sprite_cache
+from core.asset_manager import asset_manager
 
 class MachineData:
     def __init__(self, id, name, size, sprite_path, cls, icon_path=None, description="", appear_in_machine_selection=True):
@@ -26,12 +28,25 @@ class MachineData:
         self.cls = cls
         self.description = description
         self.image = None
+        self.rotated_images = [None] * 4 # the image for each rotation
         self.icon_image = None
         self.appear_in_machine_selection = appear_in_machine_selection
 
     def load_image(self):
-        self.image = pygame.image.load(self.sprite_path).convert_alpha()
-        self.icon_image = pygame.image.load(self.icon_path).convert_alpha()
+        self.image = asset_manager.get_image(self.sprite_path)
+        self.icon_image = asset_manager.get_image(self.icon_path)
+        # rotate only once, so the machines don't have to rotate their images
+        self.rotated_images = [pygame.transform.rotate(self.image, -90 * rotation) for rotation in range(4)]
+
+    def get_image(self, rotation: int):
+        return self.rotated_images[rotation % 4]
+
+    def get_scaled_image(self, rotation: int, size: tuple[int, int], smooth=False):
+        """Get the image for the rotation, scaled to size (in pixels). The scaled images are shared by all machines."""
+        image = self.get_image(rotation)
+        if image is None:
+            return None
+        return sprite_cache.get((self.id, rotation % 4), image, size, smooth)
 
 
 class MachineDatabase:
@@ -0,0 +1,52 @@
+import pygame
+from collections import OrderedDict
+
+from core.performance_tracker import performance_tracker
+
+# max. number of scaled sprites in the cache
+SPRITE_CACHE_SIZE = 512
+
+
+class SpriteCache:
+    """
+    Scaled machine sprites, shared by all machines with the same sprite.
+    A sprite is identified by a key, like (machine id, rotation). The scaled versions are cached per
+    pixel size, so the zoom is quantized to whole pixels. (the camera only uses a few distinct zoom levels)
+    The least recently used sprites are removed, if the cache is full.
+    """
+    def __init__(self, max_size=SPRITE_CACHE_SIZE):
+        self.max_size = max_size
+        self.sprites: OrderedDict[tuple, pygame.Surface] = OrderedDict() # (key, size, smooth) -> surface
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, image: pygame.Surface, size: tuple[int, int], smooth=False) -> pygame.Surface:
+        """
+        Get the image scaled to size. The image is only scaled, if it is not in the cache.
+        smooth uses smoothscale, which looks better when shrinking a lot.
+        """
+        cache_key = (key, size, smooth)
+        sprite = self.sprites.get(cache_key)
+        if sprite is not None:
+            self.sprites.move_to_end(cache_key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = pygame.transform.smoothscale(image, size) if smooth else pygame.transform.scale(image, size)
+        self.sprites[cache_key] = sprite
+        if len(self.sprites) > self.max_size:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+
+# global instance
+sprite_cache = SpriteCache()
+
+performance_tracker.register_counter(
+    "sprites",
+    lambda: f"{sprite_cache.hits} hits, {sprite_cache.misses} misses ({len(sprite_cache.sprites)}/{sprite_cache.max_size})"
+)
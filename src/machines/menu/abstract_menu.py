@@ -1,6 +1,7 @@
 import pygame
 from gui.elements.button import Button
 from gui.button_color_scheme import RED_COLORS
+from core.asset_manager import asset_manager
 
 class AbstractMenu:
     PADDING = 10
@@ -40,11 +41,11 @@ class AbstractMenu:
             rect=self.close_rect,
             text="X",
             callback=self._close_menu,
-            font=pygame.font.SysFont(None, 22),
+            font=asset_manager.get_font(None, 22),
             colors=RED_COLORS
         )
 
-        self.font = pygame.font.SysFont(None, 20)
+        self.font = asset_manager.get_font(None, 20)
 
     def set_machine(self, generator_instance):
         self.generator = generator_instance
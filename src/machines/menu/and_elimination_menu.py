@@ -1,6 +1,7 @@
 import pygame
 from machines.menu.machine_menu import MachineMenu
 from gui.elements.button import Button
+from core.asset_manager import asset_manager
 
 class AndEliminationMenu(MachineMenu):
     """
@@ -11,8 +12,8 @@ class AndEliminationMenu(MachineMenu):
     def __init__(self, screen, size, machine_instance):
         super().__init__(screen, size, machine_instance, y_offset=65)
         self.machine = machine_instance
-        self.font = pygame.font.SysFont(None, 28)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = asset_manager.get_font(None, 28)
+        self.small_font = asset_manager.get_font(None, 24)
 
         btn_w = 120
         btn_h = 40
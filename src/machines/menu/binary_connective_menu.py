@@ -2,13 +2,14 @@ import pygame
 from machines.menu.machine_menu import MachineMenu
 from gui.elements.button import Button
 from machines.types.binary_connective import BinaryConnectiveType
+from core.asset_manager import asset_manager
 
 class BinaryConnectiveMenu(MachineMenu):
     def __init__(self, screen, size, machine_instance):
         super().__init__(screen, size, machine_instance, y_offset=55)
         self.machine = machine_instance
-        self.font = pygame.font.SysFont(None, 28)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = asset_manager.get_font(None, 28)
+        self.small_font = asset_manager.get_font(None, 24)
         self.buttons = []
         self._create_buttons()
 
@@ -1,5 +1,6 @@
 import pygame
 from machines.menu.elements.tool_tip import Tooltip
+from core.asset_manager import asset_manager
 
 
 BASE_COLOR = (40, 120, 255)
@@ -11,8 +12,8 @@ class Info():
         self.rect = rect
         self.hovered = False
         
-        self.i_font = pygame.font.SysFont(None, 24, bold=True)
-        font = pygame.font.SysFont(None, 24)
+        self.i_font = asset_manager.get_font(None, 24, bold=True)
+        font = asset_manager.get_font(None, 24)
         self.tooltip = Tooltip(font, line_spacing=6)
         self.text = text
 
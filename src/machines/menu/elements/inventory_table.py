@@ -39,7 +39,7 @@ class InventoryTable:
 
         if key == "formula":
             self.items.sort(
-                key=lambda pair: str(pair[0].formula),
+                key=lambda pair: pair[0].formula.canonical,
                 reverse=reverse,
             )
 
@@ -106,7 +106,7 @@ class InventoryTable:
 
         key, _ = self.items[self.hovered_index]
 
-        if not key.assumptions:
+        if not key.assumption_mask:
             self.tooltip.hide()
             return
 
@@ -173,7 +173,7 @@ class InventoryTable:
         if not key.is_theorem:
             pygame.draw.circle(screen, (200, 200, 200), center, size)
 
-        elif key.assumptions:
+        elif key.assumption_mask:
             points = [
                 (center[0], center[1] - size),
                 (center[0] - size, center[1] + size),
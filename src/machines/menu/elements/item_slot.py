@@ -1,5 +1,6 @@
 import pygame
 from machines.menu.elements.tool_tip import Tooltip
+from core.asset_manager import asset_manager
 
 class ItemSlot:
     # An item slot (used in machine menus) to display an item. Optionally with a label on the left. (e.g "Input", "Output")
@@ -9,7 +10,7 @@ class ItemSlot:
         self.item = item
         self.hovered = False
 
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.small_font = asset_manager.get_font(None, 24)
         self.tooltip = Tooltip(self.small_font)
 
 
@@ -26,7 +27,7 @@ class ItemSlot:
                 lines = ["Theorem: " + str(self.item.formula)]
             else:
                 lines = ["Formula: " + str(self.item.formula)]
-            if self.item.assumptions:
+            if self.item.assumption_mask:
                 lines.append("")
                 lines.append("Assumptions:")
                 lines.extend([str(a) for a in self.item.assumptions])
@@ -2,13 +2,14 @@ import string
 import pygame
 from machines.menu.abstract_menu import AbstractMenu
 from gui.elements.button import Button
+from core.asset_manager import asset_manager
 
 class GeneratorMenu(AbstractMenu):
     def __init__(self, screen, size, generator_instance):
         super().__init__(screen, size)
         self.generator = generator_instance
-        self.font = pygame.font.SysFont(None, 28)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = asset_manager.get_font(None, 28)
+        self.small_font = asset_manager.get_font(None, 24)
         self.variable_buttons = [] # variables 'a' - 'z', excluding 't' and 'f'
         self.constant_buttons = [] # constants 'T' and 'F'
         self.t_mode_buttons = [] # 'T' can be a formula, of a theorem
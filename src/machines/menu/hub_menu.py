@@ -2,14 +2,15 @@ import pygame
 
 from machines.menu.abstract_menu import AbstractMenu
 from machines.menu.elements.inventory_table import InventoryTable
+from core.asset_manager import asset_manager
 
 
 class HubMenu(AbstractMenu):
     def __init__(self, screen, size, hub_instance):
         super().__init__(screen, size)
         self.hub = hub_instance
-        self.font = pygame.font.SysFont(None, 28)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = asset_manager.get_font(None, 28)
+        self.small_font = asset_manager.get_font(None, 24)
 
         table_rect = pygame.Rect(
             self.rect.x + 40,
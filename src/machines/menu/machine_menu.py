@@ -3,6 +3,7 @@ from machines.menu.abstract_menu import AbstractMenu
 from machines.menu.elements.tool_tip import Tooltip
 from machines.menu.elements.item_slot import ItemSlot
 from machines.menu.elements.info import Info
+from core.asset_manager import asset_manager
 
 class MachineMenu(AbstractMenu):
     """
@@ -25,8 +26,8 @@ class MachineMenu(AbstractMenu):
         super().__init__(screen, new_size)
         self.machine = machine
         self.y_offset = y_offset
-        self.font = pygame.font.SysFont(None, 28)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = asset_manager.get_font(None, 28)
+        self.small_font = asset_manager.get_font(None, 24)
         self.progress = 0.0
         self.title_str = machine.data.name if hasattr(self.machine, "data") else machine.__class__.__name__
         self.input_start_y = self._calculate_input_start_y()
@@ -153,8 +154,8 @@ class MachineMenu(AbstractMenu):
             # Tooltip to show the assumptions of the previous produced item
             self.tooltip.hide()
             mouse_pos = pygame.mouse.get_pos()
-            if hover_rect.collidepoint(mouse_pos) and item.assumptions:
-                if item.assumptions:
+            if hover_rect.collidepoint(mouse_pos) and item.assumption_mask:
+                if item.assumption_mask:
                     lines = ["Assumptions:"]
                     lines.extend([str(a) for a in item.assumptions])
                 self.tooltip.show(lines, (mouse_pos[0] + 16, mouse_pos[1] + 12))
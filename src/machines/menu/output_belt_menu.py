@@ -2,14 +2,15 @@ import pygame
 from machines.menu.abstract_menu import AbstractMenu
 from machines.menu.elements.inventory_table import InventoryTable
 from gui.elements.button import Button
+from core.asset_manager import asset_manager
 
 class OutputBeltMenu(AbstractMenu):
     def __init__(self, screen, size, machine_instance, hub_instance):
         super().__init__(screen, size)
         self.belt = machine_instance
         self.hub = hub_instance
-        self.font = pygame.font.SysFont(None, 28)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = asset_manager.get_font(None, 28)
+        self.small_font = asset_manager.get_font(None, 24)
 
         # table
         table_rect = pygame.Rect(
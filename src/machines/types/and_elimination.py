@@ -1,7 +1,6 @@
 from entities.item import Item
 from entities.port import Port, Direction
 from config.constants import TILE_SIZE
-from core.formula import BinaryOp
 from machines.base.logic_machine import LogicMachine
 
 
@@ -48,10 +47,7 @@ class AndElimination(LogicMachine):
         if not item.is_theorem:
             return False
 
-        if not isinstance(item.formula, BinaryOp):
-            return False
-
-        if item.formula.op != "*":
+        if item.formula.top_op != "*":
             return False
 
         # accept
@@ -67,7 +63,7 @@ class AndElimination(LogicMachine):
         left = binop.left
         right = binop.right
         chosen = left if self.selected_side == 0 else right
-        assumptions = item.assumptions
+        assumptions = item.assumption_mask
 
         # produce chosen conjunct as theorem
         return Item(
@@ -77,7 +73,7 @@ class AndElimination(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=assumptions
+            assumption_mask=assumptions
         )
 
     # save / load stuff
@@ -46,17 +46,13 @@ class AndIntroduction(LogicMachine):
     def _process_items(self):
         left, right = self.input_items
         formula = BinaryOp("*", left.formula, right.formula)
-        assumptions = set()
-        if left.assumptions:
-            assumptions.update(left.assumptions)
-        if right.assumptions:
-            assumptions.update(right.assumptions)
+        assumptions = left.assumption_mask | right.assumption_mask
 
         return Item(
             formula=formula,
             is_theorem=True,
             position=(self.origin[0]*TILE_SIZE+TILE_SIZE,
                       self.origin[1]*TILE_SIZE+TILE_SIZE),
-            assumptions=assumptions
+            assumption_mask=assumptions
         )
     
@@ -437,7 +437,27 @@ class ConveyorBeltAutoConnector:
         
         # update the ports and sprite of the neighbor
         ConveyorBeltAutoConnector._update_port_connections(neighbor, connection_system)
-        ConveyorBeltAutoConnector.update_sprite(neighbor)
+        connection_system.update_sprite(neighbor)
+
+
+    @staticmethod
+    def remove_io_to(belt: ConveyorBelt, removed_machines: set) -> None:
+        """Remove the inputs and outputs of the belt, that are connected to one of the removed machines (the machines are still connected)"""
+        for port in belt.ports:
+            if port.connected_port and port.connected_port.machine in removed_machines:
+                rotated_direction = port.direction.rotate(-belt.rotation)
+                if port.port_type == "input":
+                    belt.inputs.remove(rotated_direction)
+                elif port.port_type == "output":
+                    belt.outputs.remove(rotated_direction)
+
+
+    @staticmethod
+    def configure_after_removing(belt: ConveyorBelt, connection_system) -> None:
+        """Update a belt, after its neighbors were removed. (see remove_io_to)"""
+        ConveyorBeltAutoConnector._update_io(belt, {})
+        ConveyorBeltAutoConnector._update_port_connections(belt, connection_system)
+        connection_system.update_sprite(belt)
 
 
     @staticmethod
@@ -456,4 +476,4 @@ class ConveyorBeltAutoConnector:
         opposite_direction = direction.opposite()
         ConveyorBeltAutoConnector._update_io(neighbor, {opposite_direction: placed_machine})
         ConveyorBeltAutoConnector._update_port_connections(neighbor, connection_system)
-        ConveyorBeltAutoConnector.update_sprite(neighbor)
\ No newline at end of file
+        connection_system.update_sprite(neighbor)
\ No newline at end of file
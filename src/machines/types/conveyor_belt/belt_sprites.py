@@ -0,0 +1,53 @@
+import os
+import pygame
+
+from core.asset_manager import asset_manager
+
+BELT_SPRITE_DIR = "assets/sprites/conveyorbelts"
+
+
+class BeltSpriteTable:
+    """
+    All conveyor belt sprites, with their mirrors and rotations.
+    The sprites are loaded once (at startup), and shared by all belts.
+    So placing, rotating and reconnecting belts does not read from the disk.
+    """
+    def __init__(self):
+        self.sprites: dict[tuple[str, bool, bool, int], pygame.Surface] = {} # (path, h-mirror, v-mirror, rotation) -> surface
+
+    @staticmethod
+    def make_key(sprite_path: str, horizontal_mirror=False, vertical_mirror=False, rotation=0):
+        return os.path.normpath(sprite_path), horizontal_mirror, vertical_mirror, rotation % 4
+
+    def load(self, sprite_dir=BELT_SPRITE_DIR):
+        """Load all variants of all png files in the sprite directory"""
+        for directory, _, file_names in os.walk(sprite_dir):
+            for file_name in sorted(file_names):
+                if file_name.endswith(".png"):
+                    self._load_variants(os.path.join(directory, file_name))
+
+    def _load_variants(self, sprite_path: str):
+        image = asset_manager.get_image(sprite_path)
+        for horizontal_mirror in (False, True):
+            for vertical_mirror in (False, True):
+                # first mirror, then rotate
+                mirrored = pygame.transform.flip(image, horizontal_mirror, vertical_mirror)
+                for rotation in range(4):
+                    key = self.make_key(sprite_path, horizontal_mirror, vertical_mirror, rotation)
+                    self.sprites[key] = pygame.transform.rotate(mirrored, -90 * rotation)
+
+    def get(self, sprite_path: str, horizontal_mirror=False, vertical_mirror=False, rotation=0) -> pygame.Surface:
+        key = self.make_key(sprite_path, horizontal_mirror, vertical_mirror, rotation)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            # not preloaded (e.g. a new sprite file). Load it now, so this happens only once.
+            self._load_variants(sprite_path)
+            sprite = self.sprites[key]
+        return sprite
+
+    def __len__(self):
+        return len(self.sprites)
+
+
+# global instance. Loaded in Game, after the display is created
+belt_sprites = BeltSpriteTable()
@@ -1,10 +1,10 @@
-import pygame
-from pygame.math import Vector2
 
 from machines.base.machine import Machine
+from machines.base.sprite_cache import sprite_cache
+from machines.types.conveyor_belt.belt_sprites import belt_sprites
 from entities.item import Item
 from grid.interfaces import IUpdatable, IProvider, IReceiver
-from entities.port import Port
+from entities.port import Port, Direction
 
 class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
     def __init__(self, machine_data, rotation=0, origin=None):
@@ -12,8 +12,8 @@ class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
         self.speed = 1.0  # tiles per second
         self.item = None  # Current item on this belt. (only one item at a time)
         self.item_progress = 0.0  # 0.0 to 1.0, how far item has traveled
-        self.item_start_position = Vector2(0, 0) # tuple of (x, y) where the item starts on the belt
-        self.item_end_position = Vector2(0, 0)
+        self.item_start_position = (0, 0) # tuple of (x, y) where the item starts on the belt
+        self.item_end_position = (0, 0)
 
         # Define input and output directions
         # This can change, e.g. when the belt is a curve
@@ -28,6 +28,8 @@ class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
 
         self.was_empty_last_frame = True # no item on the belt last frame
 
+        self.sprite_key = None # identifies the current sprite in the sprite cache
+
         super().__init__(machine_data, rotation=rotation, origin=origin)
 
 
@@ -47,13 +49,20 @@ class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
             self.add_port(port)
 
     def update_sprite(self, sprite_path, horizontal_mirror=False, vertical_mirror=False):
-        """Update the sprite based on inputs and outputs"""
-        self.image = pygame.image.load(sprite_path).convert_alpha()
-        if horizontal_mirror:
-            self.image = pygame.transform.flip(self.image, True, False)
-        if vertical_mirror:
-            self.image = pygame.transform.flip(self.image, False, True)
-        self.rotate_image(self.rotation)
+        """Update the sprite based on inputs and outputs. The image is a shared entry of the belt sprite table."""
+        self.sprite_key = belt_sprites.make_key(sprite_path, horizontal_mirror, vertical_mirror, self.rotation)
+        self.image = belt_sprites.get(sprite_path, horizontal_mirror, vertical_mirror, self.rotation)
+
+    def update_image(self):
+        super().update_image()
+        # the default image of the database is used, until update_sprite() is called
+        self.sprite_key = None
+
+    def get_scaled_image(self, size, smooth=False):
+        if self.sprite_key is None:
+            return super().get_scaled_image(size, smooth)
+        # belts with the same sprite share the scaled images
+        return sprite_cache.get(self.sprite_key, self.image, size, smooth)
     
     # add 1 to the next input/output index
     def advance_output_index(self):
@@ -148,11 +157,11 @@ class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
         target_x, target_y = self.origin[0] * 32 + 16, self.origin[1] * 32 + 16  # Center of this tile
         start_x = target_x + previous_input_direction.value[0] * 32
         start_y = target_y + previous_input_direction.value[1] * 32
-        return Vector2(start_x, start_y)
+        return start_x, start_y
     
     def _get_end_position_of_item(self):
         """Get the end position of the item on the belt"""
-        return Vector2(self.origin[0] * 32 + 16, self.origin[1] * 32 + 16)
+        return self.origin[0] * 32 + 16, self.origin[1] * 32 + 16
 
         
     def _update_item_position(self):
@@ -161,7 +170,10 @@ class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
         The item starts at the center of the previous tile (the used input of this conveyor belt),
         and moves in this direction, until it reaches the center of this belt.
         """
-        self.item.position = self.item_start_position.lerp(self.item_end_position, self.item_progress)
+        start_x, start_y = self.item_start_position
+        end_x, end_y = self.item_end_position
+        self.item.x = start_x + (end_x - start_x) * self.item_progress
+        self.item.y = start_y + (end_y - start_y) * self.item_progress
     
 
     # used to write the item on the belt to the save-file
@@ -171,3 +183,16 @@ class ConveyorBelt(Machine, IUpdatable, IProvider, IReceiver):
                 "data": self.item.to_data(),
                 "progress": self.item_progress,
             }
+
+    # save / load stuff. The inputs and outputs depend on the order, in which the belts were placed. So they are saved too
+    def _add_custom_data(self, data: dict):
+        data["inputs"] = [direction.name for direction in self.inputs]
+        data["outputs"] = [direction.name for direction in self.outputs]
+
+    def _load_custom_data(self, data: dict):
+        # old saves have no inputs and outputs. Then the belt is configured by its neighbors, when it is placed
+        if data.get("inputs"):
+            self.inputs = [Direction[name] for name in data["inputs"]]
+            self.outputs = [Direction[name] for name in data.get("outputs", [])]
+            self.init_ports()
+            self.rotate_ports()
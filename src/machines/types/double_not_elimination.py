@@ -1,7 +1,6 @@
 from entities.item import Item
 from entities.port import Port, Direction
 from config.constants import TILE_SIZE
-from core.formula import Not
 from machines.base.logic_machine import LogicMachine
 
 
@@ -31,7 +30,7 @@ class DoubleNotElimination(LogicMachine):
         if not item.is_theorem:
             return False
 
-        if not isinstance(item.formula, Not) or not isinstance(item.formula.inner, Not):
+        if item.formula.top_op != "-" or item.formula.inner.top_op != "-":
             return False
 
         # accept
@@ -44,7 +43,7 @@ class DoubleNotElimination(LogicMachine):
         # extract conjunct
         item = self.input_items[0]
         inner_formula = item.formula.inner.inner
-        assumptions = item.assumptions
+        assumptions = item.assumption_mask
 
         # produce the inner formula as theorem
         return Item(
@@ -54,6 +53,6 @@ class DoubleNotElimination(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=assumptions
+            assumption_mask=assumptions
         )
     
@@ -1,7 +1,7 @@
 from entities.item import Item
 from entities.port import Port, Direction
 from config.constants import TILE_SIZE
-from core.formula import Not, Constant
+from core.formula import Constant
 from machines.base.logic_machine import LogicMachine
 
 
@@ -41,19 +41,19 @@ class FalseIntroduction(LogicMachine):
         other_item = self.input_items[other_index]
         if other_item:
             # case 1: new_item is (not old_item)
-            if isinstance(item.formula, Not) and item.formula.inner == other_item.formula:
+            if item.formula.top_op == "-" and item.formula.inner is other_item.formula:
                 self.input_items[index] = item
                 return True
             # case 2: (not new_item) is old_item
-            elif isinstance(other_item.formula, Not) and other_item.formula.inner == item.formula:
+            elif other_item.formula.top_op == "-" and other_item.formula.inner is item.formula:
                 self.input_items[index] = item
                 return True
         return False
     
     
     def _process_items(self) -> Item:
-        assumptions0 = self.input_items[0].assumptions
-        assumptions1 = self.input_items[1].assumptions
+        assumptions0 = self.input_items[0].assumption_mask
+        assumptions1 = self.input_items[1].assumption_mask
         output_assumptions = assumptions0 | assumptions1 # union
 
         return Item(
@@ -63,5 +63,5 @@ class FalseIntroduction(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=output_assumptions
+            assumption_mask=output_assumptions
         )
@@ -1,12 +1,16 @@
-import pygame
-
 from machines.base.machine import Machine
 from entities.item import Item
 from entities.port import Port, Direction
 from grid.interfaces import IUpdatable, IProvider
 from core.utils import world_to_screen
-from config.constants import TILE_SIZE, GENERATOR_LETTER_OFFSETS
+from config.constants import TILE_SIZE, GENERATOR_LETTER_OFFSETS, LOD_LABEL_MIN_ZOOM
 from core.formula import Variable, Constant
+from core.font_manager import font_manager
+
+GENERATOR_FONT_PATH = "assets/fonts/PressStart2P-Regular.ttf"
+GENERATOR_FONT_SIZE = 22
+GENERATOR_LETTER_COLOR = (15, 15, 15)
+
 
 class Generator(Machine, IUpdatable, IProvider):
     def __init__(self, machine_data, rotation=0, origin=None):
@@ -18,8 +22,6 @@ class Generator(Machine, IUpdatable, IProvider):
         self.production_interval = 2.0  # seconds between productions
         self.time_since_last_production = 0.0
 
-        #self.font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", zoomed_font_size)
-
         super().__init__(machine_data, rotation=rotation, origin=origin)
     
     def init_ports(self):
@@ -93,8 +95,8 @@ class Generator(Machine, IUpdatable, IProvider):
         self.time_since_last_production += dt
     
 
-    def draw(self, screen, camera):
-        super().draw(screen, camera)
+    def draw_overlay(self, screen, camera):
+        super().draw_overlay(screen, camera)
 
         produced_text = None
         if self.produced_constant is not None:
@@ -102,18 +104,17 @@ class Generator(Machine, IUpdatable, IProvider):
         elif self.produced_letter:
             produced_text = self.produced_letter
 
-        if produced_text:
+        # the letter is too small to read, when zoomed out
+        if produced_text and camera.zoom >= LOD_LABEL_MIN_ZOOM:
             base_x, base_y = world_to_screen(self.origin[0] * TILE_SIZE, self.origin[1] * TILE_SIZE, camera)
             offset_x, offset_y = GENERATOR_LETTER_OFFSETS[self.rotation]
 
             letter_x = base_x + offset_x * camera.zoom
             letter_y = base_y + offset_y * camera.zoom
 
-            # render letter
-            zoomed_font_size = int(22 * camera.zoom)
-            font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", zoomed_font_size)
-
-            text_surface = font.render(produced_text, True, (15, 15, 15))
+            # render letter (the fonts and rendered letters are cached per zoomed font size)
+            zoomed_font_size = int(GENERATOR_FONT_SIZE * camera.zoom)
+            text_surface = font_manager.render(GENERATOR_FONT_PATH, zoomed_font_size, produced_text, GENERATOR_LETTER_COLOR)
             text_rect = text_surface.get_rect(center=(letter_x, letter_y))
 
             screen.blit(text_surface, text_rect)
@@ -1,4 +1,5 @@
 from core.theorem_key import TheoremKey
+from core.truth_table import entails, count_variables, MAX_VARIABLES
 from entities.item import Item
 from entities.port import Port, Direction
 from config.constants import HUB_ORIGIN
@@ -28,6 +29,25 @@ class Hub(LogicMachine):
     def count(self, item: Item | TheoremKey) -> int:
         key = self._to_key(item)
         return self.storage.get(key, 0)
+
+    def find_invalid_theorems(self) -> list[TheoremKey]:
+        """
+        Check with truth tables, that every stored theorem really follows from its assumptions.
+        (Theorems without assumptions must be tautologies.) This guards against bugs in the machines.
+        Theorems with more than MAX_VARIABLES variables are not checked.
+        """
+        invalid = []
+        for key in self.storage:
+            if not key.is_theorem:
+                continue
+
+            assumptions = key.assumptions
+            if count_variables([key.formula, *assumptions]) > MAX_VARIABLES:
+                continue
+
+            if not entails(assumptions, key.formula):
+                invalid.append(key)
+        return invalid
     
 
     def init_ports(self):
@@ -125,7 +145,7 @@ class Hub(LogicMachine):
             else:
                 self.storage[filter] = amount - 1
 
-            item = Item(filter.formula, is_theorem=filter.is_theorem, assumptions=filter.assumptions)
+            item = Item(filter.formula, is_theorem=filter.is_theorem, assumption_mask=filter.assumption_mask)
             return item
         return None
 
@@ -144,3 +164,8 @@ class Hub(LogicMachine):
             for entry in data.get("storage", [])
         }
 
+        # don't load theorems that are not valid
+        for key in self.find_invalid_theorems():
+            print(f"Warning: Hub: removed invalid theorem '{key.formula}' from the save file.")
+            del self.storage[key]
+
@@ -1,7 +1,6 @@
 from entities.item import Item
 from entities.port import Port, Direction
 from config.constants import TILE_SIZE
-from core.formula import BinaryOp
 from machines.base.logic_machine import LogicMachine
 
 
@@ -27,7 +26,7 @@ class ImplicationElimination(LogicMachine):
     # IReceiver: Accept items TODO: update
     def receive_item_at_port(self, item, port):
         if port == self.ports[0]: # implication input
-            if self.input_items[0] is None and item.is_theorem and isinstance(item.formula, BinaryOp) and item.formula.op == "->":
+            if self.input_items[0] is None and item.is_theorem and item.formula.top_op == "->":
                 self.input_items[0] = item
                 return True
             else:
@@ -45,8 +44,8 @@ class ImplicationElimination(LogicMachine):
 
     def _process_items(self) -> Item:
         # get the assumptions for the output-formula
-        implication_assumptions = self.input_items[0].assumptions
-        premise_assumptions = self.input_items[1].assumptions
+        implication_assumptions = self.input_items[0].assumption_mask
+        premise_assumptions = self.input_items[1].assumption_mask
         assumptions = implication_assumptions | premise_assumptions # union
 
         # create the output
@@ -59,5 +58,5 @@ class ImplicationElimination(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=assumptions
+            assumption_mask=assumptions
         )
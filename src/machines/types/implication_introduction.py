@@ -43,9 +43,9 @@ class ImplicationIntroduction(LogicMachine):
     def _process_items(self) -> Item:
         premise = self.input_items[0].formula
         conclusion = self.input_items[1].formula
-        old_assumptions = self.input_items[1].assumptions
+        old_assumptions = self.input_items[1].assumption_mask
 
-        new_assumptions = old_assumptions - {premise}
+        new_assumptions = old_assumptions & ~premise.assumption_bit
 
         output_formula = BinaryOp("->", premise, conclusion)
 
@@ -56,6 +56,6 @@ class ImplicationIntroduction(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=new_assumptions
+            assumption_mask=new_assumptions
         )
 
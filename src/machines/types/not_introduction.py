@@ -28,14 +28,14 @@ class NotIntroduction(LogicMachine):
     # IReceiver: Accept items
     def receive_item_at_port(self, item, port):
         if port == self.ports[0]: # assumption input
-            if self.input_items[1] is None and self.input_items[0] and item.formula in self.input_items[0].assumptions:
+            if self.input_items[1] is None and self.input_items[0] and self.input_items[0].key.has_assumption(item.formula):
                 self.input_items[1] = item
                 return True
             else:
                 return False
             
         elif port == self.ports[1]: # false input
-            if self.input_items[0] is None and item.is_theorem and isinstance(item.formula, Constant) and item.formula.value == False:
+            if self.input_items[0] is None and item.is_theorem and item.formula is Constant(False):
                 self.input_items[0] = item
                 return True
             else:
@@ -46,8 +46,8 @@ class NotIntroduction(LogicMachine):
 
     def _process_items(self) -> Item:
         assumption = self.input_items[1].formula
-        old_assumptions = set(self.input_items[0].assumptions)
-        new_assumptions = old_assumptions - {assumption}
+        old_assumptions = self.input_items[0].assumption_mask
+        new_assumptions = old_assumptions & ~assumption.assumption_bit
 
         output_formula = Not(assumption)
 
@@ -58,5 +58,5 @@ class NotIntroduction(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=new_assumptions
+            assumption_mask=new_assumptions
         )
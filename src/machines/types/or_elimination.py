@@ -1,7 +1,6 @@
 from entities.item import Item
 from entities.port import Port, Direction
 from config.constants import TILE_SIZE
-from core.formula import BinaryOp
 from machines.base.logic_machine import LogicMachine
 
 
@@ -34,7 +33,7 @@ class OrElimination(LogicMachine):
     def receive_item_at_port(self, item, port):
         # accept the or-input, if the item is an or-theorem
         if port == self.ports[2]:
-            if self.input_items[2] is None and item.is_theorem and isinstance(item.formula, BinaryOp) and item.formula.op == '+':
+            if self.input_items[2] is None and item.is_theorem and item.formula.top_op == '+':
                 self.input_items[2] = item
                 return True
             else:
@@ -62,17 +61,17 @@ class OrElimination(LogicMachine):
                 return False
             
             # and we have to check the assumptions
-            if left in other_item.assumptions and right in item.assumptions:
+            if other_item.key.has_assumption(left) and item.key.has_assumption(right):
                 self.input_items[index] = item
                 return True
-            elif right in other_item.assumptions and left in item.assumptions:
+            elif other_item.key.has_assumption(right) and item.key.has_assumption(left):
                 self.input_items[index] = item
                 return True
             else:
                 return False
         # if both inputs are empty, we are more flexible.
         else:
-            if left in item.assumptions or right in item.assumptions:
+            if item.key.has_assumption(left) or item.key.has_assumption(right):
                 self.input_items[index] = item
                 return True
             else:
@@ -82,21 +81,21 @@ class OrElimination(LogicMachine):
         # the output-formula is just one of the input_formulas
         output_formula = self.input_items[0].formula
 
-        # calculate the assumptions
-        left_formula = self.input_items[2].formula.left
-        right_formula = self.input_items[2].formula.right
+        # calculate the assumptions (as bitmasks)
+        left_bit = self.input_items[2].formula.left.assumption_bit
+        right_bit = self.input_items[2].formula.right.assumption_bit
 
-        or_assumptions = self.input_items[2].assumptions
-        assumptions0 = self.input_items[0].assumptions
-        assumptions1 = self.input_items[1].assumptions
+        or_assumptions = self.input_items[2].assumption_mask
+        assumptions0 = self.input_items[0].assumption_mask
+        assumptions1 = self.input_items[1].assumption_mask
 
         # remove some assumptions
-        if left_formula in assumptions0 and right_formula in assumptions1:
-            new_assumptions0 = assumptions0 - {left_formula}
-            new_assumptions1 = assumptions1 - {right_formula}
-        elif right_formula in assumptions0 and left_formula in assumptions1:
-            new_assumptions0 = assumptions0 - {right_formula}
-            new_assumptions1 = assumptions1 - {left_formula}
+        if assumptions0 & left_bit and assumptions1 & right_bit:
+            new_assumptions0 = assumptions0 & ~left_bit
+            new_assumptions1 = assumptions1 & ~right_bit
+        elif assumptions0 & right_bit and assumptions1 & left_bit:
+            new_assumptions0 = assumptions0 & ~right_bit
+            new_assumptions1 = assumptions1 & ~left_bit
         else:
             print("ERROR in or_elimination: Wrong assumptions in the inputs. Should not happen. This should be avoided by receive_item_at_port()")
             return None
@@ -111,6 +110,6 @@ class OrElimination(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=output_assumptions
+            assumption_mask=output_assumptions
         )
 
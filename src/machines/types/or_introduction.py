@@ -56,11 +56,7 @@ class OrIntroduction(LogicMachine):
         right = self.input_items[1]
 
         output_formula = BinaryOp("+", left.formula, right.formula)
-        assumptions = set()
-        if left.assumptions:
-            assumptions.update(left.assumptions)
-        if right.assumptions:
-            assumptions.update(right.assumptions)
+        assumptions = left.assumption_mask | right.assumption_mask
 
         return Item(
             formula=output_formula,
@@ -69,5 +65,5 @@ class OrIntroduction(LogicMachine):
                 self.origin[0] * TILE_SIZE + TILE_SIZE,
                 self.origin[1] * TILE_SIZE + TILE_SIZE
             ),
-            assumptions=assumptions
+            assumption_mask=assumptions
         )
@@ -0,0 +1,61 @@
+from config.constants import HUB_ORIGIN
+from grid.grid_coordinator import GridCoordinator
+from machines.base.machine_database import MachineData
+from machines.types.conveyor_belt.belt_autoconnect import ConveyorBeltAutoConnector
+from machines.types.hub import Hub
+
+from tests.test_utils import create_belt, create_generator, initialize_pygame, place, belt_state
+
+
+# in this file we test removing all blocks in a rectangle at once (remove_blocks_in_rect)
+
+
+def test_area_erase_is_like_removing_one_by_one():
+    initialize_pygame()
+    one_by_one = GridCoordinator()
+    place(one_by_one, batch=False)
+    area = GridCoordinator()
+    place(area, batch=False)
+
+    # remove the curve and the belt merging into it
+    for x in range(3, 5):
+        for y in range(3, 5):
+            one_by_one.remove_block(x, y)
+    removed = area.remove_blocks_in_rect(3, 4, 3, 4)
+
+    assert len(removed) == 4
+    assert belt_state(area) == belt_state(one_by_one)
+    for block in removed:
+        assert all(port.connected_port is None for port in block.ports)
+
+
+def test_only_border_belts_are_updated(monkeypatch):
+    initialize_pygame()
+    grid = GridCoordinator()
+    for x in range(10):
+        grid.add_block(x, 0, create_belt())
+
+    updated = []
+    update_sprite = ConveyorBeltAutoConnector.update_sprite
+    def count_sprite_updates(belt):
+        updated.append(belt.origin)
+        update_sprite(belt)
+    monkeypatch.setattr(ConveyorBeltAutoConnector, "update_sprite", staticmethod(count_sprite_updates))
+
+    grid.remove_blocks_in_rect(2, 7, 0, 0)
+    assert sorted(updated) == [(1, 0), (8, 0)]
+    assert grid.get_block(1, 0).output_ports[0].connected_port is None
+    assert grid.get_block(8, 0).input_ports[0].connected_port is None
+
+
+def test_area_erase_keeps_the_hub():
+    initialize_pygame()
+    grid = GridCoordinator()
+    data = MachineData(id="hub", name="Hub", size=(7, 7), sprite_path="dummy.png", cls=Hub)
+    grid.add_block(*HUB_ORIGIN, Hub(data))
+    generator = create_generator()
+    grid.add_block(0, 0, generator)
+
+    removed = grid.remove_blocks_in_rect(-100, 100, -100, 100)
+    assert removed == [generator]
+    assert list(grid.grid_manager.blocks) == [HUB_ORIGIN]
@@ -0,0 +1,32 @@
+import pygame
+
+from core.asset_manager import AssetManager
+
+from tests.test_utils import initialize_pygame
+
+SPRITE_PATH = "assets/sprites/generator.png"
+FONT_PATH = "assets/fonts/PressStart2P-Regular.ttf"
+
+
+def test_assets_are_loaded_once():
+    initialize_pygame()
+    assets = AssetManager()
+    assert assets.get_font(None, 24) is assets.get_font(None, 24)
+    assert assets.get_font(None, 24) is not assets.get_font(None, 24, bold=True)
+    assert assets.get_font(FONT_PATH, 22) is assets.get_font(FONT_PATH, 22)
+    assert assets.get_image(SPRITE_PATH) is assets.get_image(SPRITE_PATH)
+
+
+def test_queued_loading():
+    initialize_pygame()
+    assets = AssetManager()
+    assets.queue(images=[SPRITE_PATH, "assets/missing.png"], fonts=[(None, 28), (None, 30)])
+
+    # with no time left, one asset is loaded per call
+    assert assets.load_queued(time_budget=0)
+    assert SPRITE_PATH in assets.images and not assets.fonts
+
+    while assets.load_queued(time_budget=0):
+        pass
+    assert (None, 28, False) in assets.fonts and (None, 30, False) in assets.fonts
+    assert "assets/missing.png" not in assets.images
@@ -0,0 +1,166 @@
+import json
+import random
+import pytest
+
+from grid.grid_coordinator import GridCoordinator
+from machines.base.machine_database import MachineDatabase
+from machines.base.machine_factory import MachineFactory
+from machines.types.conveyor_belt.belt_autoconnect import ConveyorBeltAutoConnector
+
+from tests.test_utils import BELTS, create_belt, create_generator, initialize_pygame, place, belt_state
+
+
+# in this file we test the bulk placement of blocks (begin_batch / commit).
+# The result must be the same as placing the blocks one by one.
+
+
+def test_batch_is_like_placing_one_by_one():
+    initialize_pygame()
+    one_by_one = GridCoordinator()
+    place(one_by_one, batch=False)
+    batch = GridCoordinator()
+    place(batch, batch=True)
+
+    assert belt_state(batch) == belt_state(one_by_one)
+
+    # no port is connected to a port, that does not exist anymore
+    for block in batch.grid_manager.blocks.values():
+        for port in block.ports:
+            if port.connected_port:
+                assert port.connected_port.connected_port is port
+                assert port.connected_port in port.connected_port.machine.ports
+
+
+def test_batch_is_like_placing_one_by_one_on_random_layouts():
+    initialize_pygame()
+    rng = random.Random(1)
+    for _ in range(100):
+        # 6x6 area, 60% filled with belts of random rotation
+        belts = [(x, y, rng.randrange(4)) for x in range(6) for y in range(6) if rng.random() < 0.6]
+        grids = []
+        for batch in (False, True):
+            grid = GridCoordinator()
+            if batch:
+                grid.begin_batch()
+            for x, y, rotation in belts:
+                grid.add_block(x, y, create_belt(rotation=rotation))
+            if batch:
+                grid.commit()
+            grids.append(grid)
+        assert belt_state(grids[1]) == belt_state(grids[0])
+
+
+def create_test_database():
+    database = MachineDatabase()
+    database.register_machine(create_belt().data)
+    database.register_machine(create_generator().data)
+    return database
+
+
+def place_random_layout(grid, rng):
+    # 6x6 area with a generator at the left, 60% filled with belts of random rotation
+    generator = create_generator(rotation=rng.randrange(4))
+    generator.origin = (-3, 1)
+    grid.add_block(-3, 1, generator)
+    for x in range(6):
+        for y in range(6):
+            if rng.random() < 0.6:
+                belt = create_belt(rotation=rng.randrange(4))
+                belt.origin = (x, y)
+                grid.add_block(x, y, belt)
+
+
+def test_saved_belts_are_loaded_in_one_pass(monkeypatch):
+    initialize_pygame()
+    database = create_test_database()
+    rng = random.Random(2)
+    saves = []
+    for _ in range(30):
+        grid = GridCoordinator()
+        place_random_layout(grid, rng)
+        saves.append((json.loads(json.dumps(grid.to_data())), belt_state(grid)))
+
+    # the belts have their inputs and outputs from the save, so they are not configured again
+    def fail(*args):
+        raise AssertionError("belt configured while loading")
+    monkeypatch.setattr(ConveyorBeltAutoConnector, "_update_io", staticmethod(fail))
+
+    for data, state in saves:
+        loaded = GridCoordinator()
+        loaded.from_data(data, database)
+        assert belt_state(loaded) == state
+        for block in loaded.grid_manager.blocks.values():
+            for port in block.ports:
+                if port.connected_port:
+                    assert port.connected_port.connected_port is port
+
+
+def test_old_saves_are_loaded_like_before():
+    initialize_pygame()
+    database = create_test_database()
+    rng = random.Random(3)
+    for _ in range(30):
+        grid = GridCoordinator()
+        place_random_layout(grid, rng)
+        data = grid.to_data()
+        # saves without the inputs and outputs of the belts. The belts are configured by their neighbors again
+        for machine_data in data["machines"]:
+            machine_data.pop("inputs", None)
+            machine_data.pop("outputs", None)
+
+        loaded = GridCoordinator()
+        loaded.from_data(data, database)
+        one_by_one = GridCoordinator()
+        for machine_data in data["machines"]:
+            machine = MachineFactory.from_data(machine_data, database)
+            one_by_one.add_block(machine.origin[0], machine.origin[1], machine)
+        assert belt_state(loaded) == belt_state(one_by_one)
+
+
+def test_batch_updates_each_sprite_once(monkeypatch):
+    initialize_pygame()
+    updated = []
+    update_sprite = ConveyorBeltAutoConnector.update_sprite
+    def count_sprite_updates(belt):
+        updated.append(belt)
+        update_sprite(belt)
+    monkeypatch.setattr(ConveyorBeltAutoConnector, "update_sprite", staticmethod(count_sprite_updates))
+
+    grid = GridCoordinator()
+    place(grid, batch=True)
+    assert len(updated) == len(BELTS)
+    assert len(set(updated)) == len(BELTS)
+
+
+def test_batch_updates_existing_neighbors():
+    initialize_pygame()
+    grid = GridCoordinator()
+    existing = create_belt()
+    grid.add_block(1, 0, existing)
+
+    grid.begin_batch()
+    grid.add_block(0, 0, create_belt())
+    grid.add_block(2, 0, create_belt())
+    grid.commit()
+
+    assert all(port.connected_port for port in existing.ports)
+
+
+def test_failed_load_closes_the_batch():
+    initialize_pygame()
+    grid = GridCoordinator()
+    with pytest.raises(ValueError):
+        grid.from_data({"machines": [{"type": "unknown"}]}, MachineDatabase())
+
+    # the next blocks are connected immediately again
+    grid.add_block(0, 0, create_belt())
+    assert grid.get_block(0, 0).sprite_key is not None
+
+
+def test_commit_without_batch():
+    grid = GridCoordinator()
+    with pytest.raises(ValueError):
+        grid.commit()
+    grid.begin_batch()
+    with pytest.raises(ValueError):
+        grid.begin_batch()
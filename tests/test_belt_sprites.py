@@ -0,0 +1,45 @@
+import pygame
+import pytest
+
+from grid.grid_coordinator import GridCoordinator
+from machines.types.conveyor_belt.belt_sprites import BeltSpriteTable, belt_sprites
+
+from tests.test_utils import create_belt, initialize_pygame
+
+
+# the belt sprites are loaded once. Placing belts should not load anything from the disk.
+
+
+@pytest.fixture
+def grid():
+    initialize_pygame()
+    belt_sprites.load()
+    return GridCoordinator()
+
+
+def test_all_variants_are_loaded():
+    initialize_pygame()
+    table = BeltSpriteTable()
+    table.load()
+    # 2 straight belts, 8 curves, 8 intersections and 10 crosssections. Each with 4 mirrors and 4 rotations
+    assert len(table) == 28 * 16
+
+    normal = table.get("assets/sprites/conveyorbelts/normal/horizontal.png")
+    rotated = table.get("assets/sprites/conveyorbelts/normal/horizontal.png", rotation=1)
+    expected = pygame.transform.rotate(normal, -90)
+    assert pygame.image.tobytes(rotated, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+
+def test_placing_belts_does_not_load_images(grid, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("image loaded from disk")
+    monkeypatch.setattr(pygame.image, "load", fail)
+
+    belts = [create_belt() for _ in range(10)]
+    for x, belt in enumerate(belts):
+        grid.add_block(x, 0, belt)
+    grid.add_block(10, 1, create_belt(rotation=3)) # a curve
+
+    # all straight belts share one sprite
+    assert belts[3].image is belts[4].image
+    assert belts[3].image is belt_sprites.get("assets/sprites/conveyorbelts/normal/horizontal.png")
@@ -0,0 +1,67 @@
+from config.constants import HUB_ORIGIN
+from grid.grid_manager import GridManager
+from machines.base.machine_database import MachineData
+from machines.types.conveyor_belt.output_belt import OutputBelt
+
+from tests.test_utils import create_belt, create_generator
+
+
+# in this file we test the per-role registries of the grid manager
+
+
+def create_output_belt(origin, rotation=0):
+    data = MachineData(
+        id="conveyor",
+        name="Conveyor Belt",
+        size=(1, 1),
+        sprite_path="dummy.png",
+        cls=OutputBelt
+    )
+    return OutputBelt(data, rotation=rotation, origin=origin)
+
+
+def test_blocks_are_registered_by_role():
+    grid = GridManager()
+    belt = create_belt()
+    generator = create_generator()
+    grid.add_block(0, 0, belt)
+    grid.add_block(5, 5, generator)
+
+    assert grid.belts == {(0, 0): belt}
+    assert grid.machines == {(5, 5): generator}
+    assert set(grid.updatables.values()) == {belt, generator}
+    assert set(grid.providers.values()) == {belt, generator}
+    assert grid.output_belts == {}
+
+    grid.remove_block(6, 6) # any tile of the generator
+    assert grid.machines == {}
+    assert list(grid.updatables.values()) == [belt]
+
+    grid.reset()
+    assert grid.belts == {} and grid.updatables == {} and grid.providers == {}
+
+
+def test_rotating_an_output_belt_updates_its_role():
+    grid = GridManager()
+    origin = (HUB_ORIGIN[0] - 1, HUB_ORIGIN[1]) # left of the hub
+    belt = create_output_belt(origin, rotation=2) # pointing away from the hub
+    grid.add_block(*origin, belt)
+    assert grid.output_belts == {origin: belt}
+
+    grid.rotate_block(belt, 2) # now pointing into the hub
+    assert belt.rotation == 0
+    assert grid.output_belts == {}
+
+    grid.rotate_block(belt, 1)
+    assert grid.output_belts == {origin: belt}
+
+
+def test_blocks_in_rect_with_role():
+    grid = GridManager()
+    belt = create_belt()
+    generator = create_generator()
+    grid.add_block(0, 0, belt)
+    grid.add_block(1, 0, generator)
+
+    assert grid.blocks_in_rect(0, 5, 0, 5, grid.belts) == [belt]
+    assert grid.blocks_in_rect(0, 5, 0, 5, grid.machines) == [generator]
@@ -0,0 +1,26 @@
+import pygame
+
+from config.constants import TILE_SIZE
+from core.camera import Camera
+
+from tests.test_utils import initialize_pygame
+
+
+def test_view_is_computed_once_per_frame(monkeypatch):
+    initialize_pygame()
+    camera = Camera()
+    camera.offset_x = -TILE_SIZE
+    camera.zoom = 2.0
+    camera.update_view((4 * TILE_SIZE, 2 * TILE_SIZE))
+
+    assert camera.view_rect == (-TILE_SIZE, 0, 2 * TILE_SIZE, TILE_SIZE)
+
+    # the render passes must not ask the display again
+    def fail():
+        raise AssertionError("get_surface() called")
+    monkeypatch.setattr(pygame.display, "get_surface", fail)
+    assert camera.get_visible_tile_bounds() == (-1, 2, 0, 2)
+
+    camera.move(10 * TILE_SIZE, 0)
+    camera.update_view((4 * TILE_SIZE, 2 * TILE_SIZE))
+    assert camera.get_visible_tile_bounds() == (9, 12, 0, 2)
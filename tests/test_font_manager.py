@@ -0,0 +1,25 @@
+import pygame
+
+from core.font_manager import FontManager
+
+FONT_PATH = "assets/fonts/PressStart2P-Regular.ttf"
+
+
+def test_fonts_are_shared_per_size_bucket():
+    pygame.font.init()
+    fonts = FontManager()
+    font = fonts.get_font(FONT_PATH, 22)
+    assert fonts.get_font(FONT_PATH, 22.4) is font
+    assert fonts.get_font(FONT_PATH, 30) is not font
+
+
+def test_rendered_texts_are_cached():
+    pygame.font.init()
+    fonts = FontManager(text_cache_size=2)
+    a = fonts.render(FONT_PATH, 22, "a", (15, 15, 15))
+    assert fonts.render(FONT_PATH, 22, "a", (15, 15, 15)) is a
+    assert fonts.render(FONT_PATH, 22, "b", (15, 15, 15)) is not a
+
+    # the least recently used text is removed
+    fonts.render(FONT_PATH, 22, "c", (15, 15, 15))
+    assert fonts.render(FONT_PATH, 22, "a", (15, 15, 15)) is not a
@@ -0,0 +1,83 @@
+from core.formula import Variable, Constant, Not, BinaryOp
+from core.formula_parser import parse_formula
+
+
+# in this file we test the formula classes. Structurally equal formulas should be the same object.
+
+
+def test_equal_variables_are_the_same_object():
+    assert Variable("a") is Variable("a")
+    assert Variable("a") is not Variable("b")
+
+
+def test_equal_constants_are_the_same_object():
+    assert Constant(True) is Constant(True)
+    assert Constant(False) is not Constant(True)
+
+
+def test_equal_compound_formulas_are_the_same_object():
+    formula1 = BinaryOp("->", Not(Variable("a")), BinaryOp("+", Variable("b"), Variable("c")))
+    formula2 = BinaryOp("->", Not(Variable("a")), BinaryOp("+", Variable("b"), Variable("c")))
+    assert formula1 is formula2
+    assert formula1 == formula2
+    assert hash(formula1) == hash(formula2)
+
+    # different operator -> different formula
+    assert BinaryOp("*", Variable("a"), Variable("b")) != BinaryOp("+", Variable("a"), Variable("b"))
+
+
+def test_parsed_formulas_are_shared():
+    assert parse_formula("(a*b)+c") is BinaryOp("+", BinaryOp("*", Variable("a"), Variable("b")), Variable("c"))
+
+
+def test_formulas_as_dict_keys():
+    storage = {parse_formula("a -> b"): 3}
+    assert storage[BinaryOp("->", Variable("a"), Variable("b"))] == 3
+    assert parse_formula("b -> a") not in storage
+
+
+def test_negations_have_different_hashes():
+    a = Variable("a")
+    assert len({hash(a), hash(Not(a)), hash(Not(Not(a))), hash(Not(Not(Not(a))))}) == 4
+
+
+def test_deep_negation_chain_hashes_without_recursion():
+    formula = Variable("a")
+    for _ in range(10000):
+        formula = Not(formula)
+    hashes = {formula: 1}
+    assert hashes[formula] == 1
+    assert not hasattr(formula, "__dict__")
+
+
+def test_formula_metrics():
+    formula = parse_formula("(a * -b) -> a")
+    assert formula.size == 6
+    assert formula.depth == 3
+    assert formula.top_op == "->"
+    assert formula.left.right.top_op == "-"
+    assert Variable("a").top_op is None and Constant(False).depth == 0
+
+    # the variable mask is the set of variables
+    assert formula.variable_mask == Variable("a").variable_mask | Variable("b").variable_mask
+    assert Constant(True).variable_mask == 0
+
+    assert formula.canonical == "a * -b -> a"
+
+
+def test_str_of_deep_formulas():
+    formula = Variable("a")
+    for _ in range(5000):
+        formula = BinaryOp("->", formula, Not(Variable("b")))
+    text = str(formula)
+
+    assert text.startswith("(" * 4999 + "a -> -b)")
+    assert str(formula) is text # memoized
+    assert parse_formula(text) is formula
+
+
+def test_str_reuses_rendered_subformulas():
+    inner = parse_formula("a + b")
+    assert str(inner) == "a + b"
+    assert str(Not(inner)) == "-(a + b)"
+    assert str(BinaryOp("*", inner, Not(Not(Variable("c"))))) == "(a + b) * --c"
@@ -0,0 +1,105 @@
+import gc
+import sys
+import tracemalloc
+
+from core.formula import Variable, Constant, Not, BinaryOp
+from core.formula_arena import formula_arena, KIND_VARIABLE, KIND_NOT, KIND_BINARY_OP, NO_CHILD
+from core.formula_parser import parse_formula
+from core.theorem_key import TheoremKey
+
+
+# in this file we test the formula arena. Every distinct formula is one row, and Formula-objects are views of the rows.
+
+
+def test_rows_of_a_formula():
+    formula = parse_formula("-x1 -> y1")
+    left, right = formula.left, formula.right
+
+    assert formula_arena.kinds[formula.id] == KIND_BINARY_OP
+    assert formula_arena.operator(formula.id) == "->"
+    assert formula_arena.lefts[formula.id] == left.id
+    assert formula_arena.rights[formula.id] == right.id
+
+    assert formula_arena.kinds[left.id] == KIND_NOT
+    assert formula_arena.lefts[left.id] == left.inner.id
+    assert formula_arena.rights[left.id] == NO_CHILD
+
+    assert formula_arena.kinds[right.id] == KIND_VARIABLE
+    assert formula_arena.name_table[formula_arena.names[right.id]] == "y1"
+
+
+def test_equal_formulas_share_one_row():
+    size = len(formula_arena)
+    formula = BinaryOp("*", Not(Constant(True)), Variable("z1"))
+    new_rows = len(formula_arena) - size
+
+    assert BinaryOp("*", Not(Constant(True)), Variable("z1")).id == formula.id
+    assert len(formula_arena) - size == new_rows
+    assert formula_arena.view(formula.id) is formula
+
+
+def test_theorem_key_stores_the_formula_id():
+    formula = parse_formula("a + b")
+    key = TheoremKey.create(formula, [parse_formula("a")], True)
+
+    assert key.formula_id == formula.id
+    assert key.formula is formula
+    assert key == TheoremKey.create(parse_formula("a+b"), [Variable("a")], True)
+    assert key != TheoremKey.create(formula, [], True)
+
+
+def test_unused_formulas_are_freed():
+    a = Variable("a")
+    rows = len(formula_arena)
+    rows_total = len(formula_arena.kinds)
+
+    # intermediate formulas, like in a feedback loop
+    formula = a
+    for _ in range(100):
+        formula = Not(formula)
+    assert len(formula_arena) == rows + 100
+
+    formula_id = formula.id
+    del formula
+    assert len(formula_arena) == rows
+    assert formula_arena.find(KIND_NOT, -1, a.id, NO_CHILD, 0) is None
+
+    # the free rows are reused
+    for _ in range(100):
+        a = Not(a)
+    assert len(formula_arena.kinds) <= rows_total + 100 + 1
+    assert len(formula_arena) == rows + 100
+
+
+def test_theorem_key_keeps_its_formula_alive():
+    key = TheoremKey.create(parse_formula("(q1 * q2) -> q3"), [parse_formula("q4 + q5")], True)
+    parse_formula.cache_clear() # the parse cache holds the formulas as well
+
+    assert str(key.formula) == "q1 * q2 -> q3"
+    assert formula_arena.view(key.formula_id) is key.formula
+    assert [str(a) for a in key.assumptions] == ["q4 + q5"]
+
+    # the key only holds ints. The row is freed with the last key
+    assert all(isinstance(getattr(key, name), (int, bool)) for name in TheoremKey.__slots__)
+    rows = len(formula_arena)
+    copy = TheoremKey(key.formula_id, key.assumption_mask, key.is_theorem)
+    del key
+    assert len(formula_arena) == rows
+    del copy
+    assert len(formula_arena) < rows
+
+
+def test_memory_per_formula():
+    variables = [Variable(f"m{i}") for i in range(200)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        formulas = [BinaryOp("->", x, y) for x in variables for y in variables]
+        per_formula = (tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(formulas)) / len(formulas)
+    finally:
+        tracemalloc.stop()
+
+    # the view, its weak reference, the entry in the lookup table and the row.
+    # (a formula as plain object tree, before the arena, needed about 300 bytes. With a closure per row it was about 700)
+    assert per_formula < 290
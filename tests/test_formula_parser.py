@@ -0,0 +1,81 @@
+import pytest
+
+from core.formula import Variable, Constant, Not, BinaryOp
+from core.formula_parser import parse_formula, FormulaParseError
+
+a, b, c = Variable("a"), Variable("b"), Variable("c")
+
+
+# ------------ grammar ------------
+def test_parse_atoms():
+    assert parse_formula("a") is a
+    assert parse_formula(" abc ") is Variable("abc")
+    assert parse_formula("T") is Constant(True)
+    assert parse_formula("F") is Constant(False)
+
+
+def test_parse_priorities():
+    # "->" binds weakest, "+" and "*" bind equally strong
+    assert parse_formula("a * b -> c") is BinaryOp("->", BinaryOp("*", a, b), c)
+    assert parse_formula("a -> b + c") is BinaryOp("->", a, BinaryOp("+", b, c))
+    assert parse_formula("(a*b)+c") is BinaryOp("+", BinaryOp("*", a, b), c)
+
+
+def test_parse_left_associative():
+    assert parse_formula("a -> b -> c") is BinaryOp("->", BinaryOp("->", a, b), c)
+    assert parse_formula("a -> (b -> c)") is BinaryOp("->", a, BinaryOp("->", b, c))
+
+
+def test_parse_negation():
+    # the negation binds stronger than the binary operators
+    assert parse_formula("-a + b") is BinaryOp("+", Not(a), b)
+    assert parse_formula("-(a + b)") is Not(BinaryOp("+", a, b))
+    assert parse_formula("--a->-b") is BinaryOp("->", Not(Not(a)), Not(b))
+
+
+def test_parse_inverts_str():
+    for text in ["(a * b) + c", "d -> (e + f)", "-(a -> b) * --c", "(a -> F) -> -a", "-a + b"]:
+        formula = parse_formula(text)
+        assert parse_formula(str(formula)) is formula
+
+
+# ------------ errors ------------
+@pytest.mark.parametrize("text, position", [
+    ("", 0),
+    ("a +", 3),
+    ("a b", 2),
+    ("(a + b", 0),
+    ("a + b)", 5),
+    ("a & b", 2),
+    ("-> a", 0),
+])
+def test_parse_errors_report_position(text, position):
+    with pytest.raises(FormulaParseError) as error:
+        parse_formula(text)
+    assert error.value.position == position
+
+
+# ------------ big formulas ------------
+def test_parse_long_formulas_without_recursion():
+    n = 5000
+    nested = parse_formula("(" * n + "a" + ")" * n)
+    assert nested is a
+
+    negated = parse_formula("-" * n + "a")
+    for _ in range(n):
+        negated = negated.inner
+    assert negated is a
+
+    chain = parse_formula(" -> ".join(["a"] * n))
+    assert chain.op == "->" and chain.right is a
+
+
+# ------------ cache ------------
+def test_parse_cache_returns_shared_formula():
+    parse_formula.cache_clear()
+    first = parse_formula("(a + b) -> c")
+    second = parse_formula("(a + b) -> c")
+    assert first is second
+
+    info = parse_formula.cache_info()
+    assert info.hits == 1 and info.misses == 1
@@ -0,0 +1,79 @@
+import pygame
+
+from config.constants import TILE_SIZE, GRID_LINE_COLOR
+from core.camera import Camera
+from grid.grid_coordinator import GridCoordinator
+from grid.grid_renderer import GridRenderer
+from machines.base.machine_database import MachineData
+from machines.types.generator import Generator, GENERATOR_LETTER_COLOR
+
+from tests.test_utils import create_generator, initialize_pygame
+
+
+def test_grid_lines_use_the_view_of_the_frame(monkeypatch):
+    initialize_pygame()
+    camera = Camera()
+    camera.offset_x = -TILE_SIZE // 2
+    camera.offset_y = TILE_SIZE // 4
+    screen = pygame.Surface((3 * TILE_SIZE, 2 * TILE_SIZE))
+    camera.update_view(screen.get_size())
+
+    # the lines are drawn from the cached view, the display is not asked again
+    def fail():
+        raise AssertionError("get_surface() called")
+    monkeypatch.setattr(pygame.display, "get_surface", fail)
+    GridRenderer(None).draw_grid_lines(screen, camera)
+
+    line_xs = [x for x in range(screen.get_width()) if screen.get_at((x, 1))[:3] == GRID_LINE_COLOR]
+    line_ys = [y for y in range(screen.get_height()) if screen.get_at((1, y))[:3] == GRID_LINE_COLOR]
+    assert line_xs == [TILE_SIZE // 2, 3 * TILE_SIZE // 2, 5 * TILE_SIZE // 2]
+    assert line_ys == [3 * TILE_SIZE // 4, 7 * TILE_SIZE // 4]
+
+
+def create_generator_with_sprite(color):
+    # Dummy MachineData with a plain colored sprite (the id keeps its scaled sprites apart in the sprite cache)
+    data = MachineData(
+        id="generator_sprite_test",
+        name="Generator",
+        size=(3, 3),
+        sprite_path="dummy.png",
+        cls=Generator
+    )
+    sprite = pygame.Surface((3 * TILE_SIZE, 3 * TILE_SIZE))
+    sprite.fill(color)
+    data.rotated_images = [sprite] * 4
+    return Generator(data)
+
+
+def letter_pixels(screen, left):
+    """Count the pixels of the generator letter inside the generator at (left, 0)"""
+    return sum(
+        1
+        for x in range(left, left + 3 * TILE_SIZE)
+        for y in range(3 * TILE_SIZE)
+        if screen.get_at((x, y))[:3] == GENERATOR_LETTER_COLOR
+    )
+
+
+def test_machines_are_drawn_in_layers():
+    initialize_pygame()
+    grid = GridCoordinator()
+    with_sprite = create_generator_with_sprite((200, 0, 0))
+    with_sprite.change_letter("a")
+    grid.add_block(0, 0, with_sprite)
+    without_sprite = create_generator()  # dummy.png is not loaded, so it is drawn as a rectangle
+    without_sprite.change_letter("b")
+    grid.add_block(3, 0, without_sprite)
+    assert with_sprite.image is not None and without_sprite.image is None
+
+    camera = Camera()
+    screen = pygame.Surface((6 * TILE_SIZE, 3 * TILE_SIZE))
+    camera.update_view(screen.get_size())
+    GridRenderer(grid.grid_manager).draw_machines(screen, camera)
+
+    # the sprite and the fallback rectangle are drawn ...
+    assert screen.get_at((2, 2))[:3] == (200, 0, 0)
+    assert screen.get_at((3 * TILE_SIZE + 2, 2))[:3] == without_sprite.color
+    # ... and the letters are drawn on top of both
+    assert letter_pixels(screen, 0) > 0
+    assert letter_pixels(screen, 3 * TILE_SIZE) > 0
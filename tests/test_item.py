@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pygame
+
+from core.formula_parser import parse_formula
+from entities.item import Item
+from entities.item_renderer import draw_items, DOT_COLORS
+from entities.port import Direction
+
+from tests.test_utils import create_belt
+
+
+# items are pure data, so the simulation runs without pygame.init() and without a display.
+# (only the renderer needs pygame)
+
+
+def test_item_is_pure_data():
+    item = Item(parse_formula("a -> b"), is_theorem=True, position=(16, 48), assumptions=[parse_formula("a")])
+    assert not hasattr(item, "__dict__")
+    assert (item.x, item.y) == (16, 48)
+    assert item.position == (16, 48)
+
+    item.position = (1, 2)
+    assert item.to_data()["position"] == [1, 2]
+
+
+def test_item_module_does_not_import_pygame():
+    code = "import sys; import entities.item; assert 'pygame' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.join(os.path.dirname(__file__), "..", "src"), check=True)
+
+
+def test_item_moves_on_conveyor_belt_without_display():
+    belt = create_belt(rotation=0, inputs=[Direction.WEST], outputs=[Direction.EAST])
+    belt.origin = (2, 0)
+    item = Item(parse_formula("a"))
+
+    assert belt.receive_item_at_port(item, belt.input_ports[0])
+    belt.update(0.5)
+    # halfway from the center of the tile on the left, to the center of the belt
+    assert (item.x, item.y) == (64, 16)
+
+    belt.update(1.0)
+    assert (item.x, item.y) == (80, 16)
+
+
+def test_zoomed_out_items_are_drawn_as_dots():
+    screen = pygame.Surface((100, 100))
+    camera = SimpleNamespace(offset_x=0, offset_y=0, zoom=0.3)
+    items = [Item(parse_formula("a"), position=(100, 100)), Item(parse_formula("a"), is_theorem=True, position=(200, 100))]
+    draw_items(screen, camera, items)
+
+    assert screen.get_at((30, 30))[:3] == DOT_COLORS[0]
+    assert screen.get_at((60, 30))[:3] == DOT_COLORS[1]
+    assert screen.get_at((45, 30))[:3] == (0, 0, 0)
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+from core.formula_parser import parse_formula
+from entities.item_glyphs import ItemGlyphAtlas, glyph_rings, CONNECTIVE_COLORS
+
+
+# the glyphs are drawn on plain surfaces, so no display is needed
+
+
+def test_glyph_rings_follow_the_structure():
+    rings = glyph_rings(parse_formula("(a * b) -> -c"))
+    assert rings[0] == [CONNECTIVE_COLORS["->"]]
+    assert rings[1] == [CONNECTIVE_COLORS["*"], CONNECTIVE_COLORS["-"]]
+    assert len(rings[2]) == 3 # a, b and c
+
+    assert glyph_rings(parse_formula("a -> b")) != glyph_rings(parse_formula("b -> a"))
+    assert glyph_rings(parse_formula("a -> b")) != glyph_rings(parse_formula("a + b"))
+
+
+def test_atlas_shares_one_slot_per_formula():
+    atlas = ItemGlyphAtlas(columns=2, glyph_size=16)
+    formula1 = parse_formula("(a * b) + (c -> d)")
+    formula2 = parse_formula("(a * b) + (d -> c)")
+
+    slot1 = atlas.get_slot(formula1)
+    slot2 = atlas.get_slot(formula2)
+    assert slot1 != slot2
+    assert atlas.get_slot(formula1) == slot1
+
+    rect1, rect2 = atlas._slot_rect(slot1, 16), atlas._slot_rect(slot2, 16)
+    pixels1 = [atlas.atlas.get_at((rect1.x + x, rect1.y + 8)) for x in range(16)]
+    pixels2 = [atlas.atlas.get_at((rect2.x + x, rect2.y + 8)) for x in range(16)]
+    assert pixels1 != pixels2
+
+
+def test_atlas_replaces_least_recently_used_glyph():
+    atlas = ItemGlyphAtlas(columns=2, glyph_size=16)
+    formulas = [parse_formula(f"a{i} -> b") for i in range(5)]
+    slots = [atlas.get_slot(formula) for formula in formulas[:4]]
+    atlas.begin_frame()
+    atlas.begin_frame()
+    atlas.get_slot(formulas[0]) # formulas[1] is now the least recently used, and not visible anymore
+
+    assert atlas.get_slot(formulas[4]) == slots[1]
+    assert formulas[1] not in atlas.slots and len(atlas.slots) == 4
+
+
+def test_atlas_grows_for_visible_glyphs():
+    atlas = ItemGlyphAtlas(columns=2, glyph_size=16)
+    formulas = [parse_formula(f"a{i} -> b") for i in range(6)]
+    slots = [atlas.get_slot(formula) for formula in formulas]
+
+    # all glyphs are visible in this frame, so none is replaced
+    assert len(set(slots)) == 6
+    assert atlas.capacity == 8 and atlas.atlas.get_size() == (32, 64)
+    assert [atlas.get_slot(formula) for formula in formulas] == slots
+
+
+def test_glyph_colors_are_the_same_in_every_session():
+    # hash() of strings changes with PYTHONHASHSEED. The glyphs must not.
+    script = (
+        "from core.formula_parser import parse_formula\n"
+        "from entities.item_glyphs import glyph_rings, _center_color\n"
+        "formula = parse_formula('(b * a) -> (c + -d)')\n"
+        "print(glyph_rings(formula), _center_color(formula))"
+    )
+    src_path = os.path.join(os.path.dirname(__file__), "..", "src")
+    outputs = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=src_path)
+        result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        outputs.add(result.stdout)
+    assert len(outputs) == 1
+
+
+def test_scaled_atlas_is_updated_for_new_glyphs():
+    atlas = ItemGlyphAtlas(columns=2, glyph_size=16)
+    surface, rect = atlas.get_scaled(parse_formula("a -> b"), zoom=0.5, size=16)
+    assert rect.size == (8, 8)
+
+    new_surface, new_rect = atlas.get_scaled(parse_formula("b -> a"), zoom=0.5, size=16)
+    assert new_surface is surface and new_rect != rect
+    assert new_surface.get_at(new_rect.center).a == 255
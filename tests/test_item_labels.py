@@ -0,0 +1,111 @@
+import pygame
+
+from core.formula_parser import parse_formula
+from core.performance_tracker import performance_tracker
+from entities.item_labels import ItemLabelCache, item_label_cache, ZOOM_BUCKET_SIZE
+
+from tests.test_utils import initialize_pygame
+
+
+# in this file we test the shared cache of the item labels
+
+
+def draw_frame(cache, formulas):
+    # like the renderer: the labels are requested in the same order every frame
+    cache.begin_frame()
+    return [cache.get(formula) for formula in formulas]
+
+
+def test_each_formula_is_rendered_once():
+    initialize_pygame()
+    cache = ItemLabelCache(max_size=4)
+    formula = parse_formula("a -> b")
+
+    label = cache.get(formula)
+    assert cache.get(parse_formula("a -> b")) is label
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_grows_to_the_visible_formulas():
+    initialize_pygame()
+    cache = ItemLabelCache(max_size=4)
+    formulas = [parse_formula(f"a{i} -> b") for i in range(10)]
+
+    draw_frame(cache, formulas)
+    assert (cache.hits, cache.misses) == (0, 10)
+    draw_frame(cache, formulas)
+    draw_frame(cache, formulas)
+    assert (cache.hits, cache.misses) == (20, 10)
+    assert len(cache.labels) == 10
+
+    # a new formula does not push out the labels, that are needed later in the frame
+    cache.begin_frame()
+    cache.get(parse_formula("x -> y"))
+    for formula in formulas:
+        cache.get(formula)
+    assert (cache.hits, cache.misses) == (30, 11)
+
+
+def test_cache_shrinks_to_max_size():
+    initialize_pygame()
+    cache = ItemLabelCache(max_size=4)
+    formulas = [parse_formula(f"a{i} -> b") for i in range(10)]
+    draw_frame(cache, formulas)
+
+    # only two formulas are visible now. The labels of the last frame are kept for one more frame
+    draw_frame(cache, formulas[:2])
+    assert len(cache.labels) == 10
+    draw_frame(cache, formulas[:2])
+    assert len(cache.labels) == 4
+    assert formulas[0] in cache.labels and formulas[1] in cache.labels
+    assert formulas[2] not in cache.labels
+
+
+def test_overlay_counter():
+    initialize_pygame()
+    item_label_cache.clear()
+    hits, misses = item_label_cache.hits, item_label_cache.misses
+    item_label_cache.get(parse_formula("c -> d"))
+    item_label_cache.get(parse_formula("c -> d"))
+
+    expected = f"{hits + 1} hits, {misses + 1} misses (1/{item_label_cache.max_size})"
+    assert performance_tracker.get_counters()["item labels"] == expected
+
+
+def count_smoothscale(monkeypatch):
+    calls = []
+    smoothscale = pygame.transform.smoothscale
+    def counting_smoothscale(surface, size):
+        calls.append(size)
+        return smoothscale(surface, size)
+    monkeypatch.setattr(pygame.transform, "smoothscale", counting_smoothscale)
+    return calls
+
+
+def test_second_frame_at_same_zoom_does_not_rescale(monkeypatch):
+    initialize_pygame()
+    calls = count_smoothscale(monkeypatch)
+    cache = ItemLabelCache(max_size=4)
+    formulas = [parse_formula(f"a{i} * b") for i in range(200)]
+
+    for zoom in (1.0, 1.0, 1.01): # 1.01 is in the same zoom bucket
+        cache.begin_frame()
+        for formula in formulas:
+            cache.get_scaled(formula, zoom)
+    assert len(calls) == 200
+
+
+def test_zoom_is_quantized_into_buckets(monkeypatch):
+    initialize_pygame()
+    calls = count_smoothscale(monkeypatch)
+    cache = ItemLabelCache()
+    formula = parse_formula("a + b")
+
+    scaled = cache.get_scaled(formula, 1.0)
+    assert cache.get_scaled(formula, 1.0 + ZOOM_BUCKET_SIZE / 3) is scaled
+
+    # a new zoom bucket clears the scaled labels
+    bigger = cache.get_scaled(formula, 1.0 + ZOOM_BUCKET_SIZE)
+    assert bigger.get_width() > scaled.get_width()
+    assert list(cache.scaled_labels) == [formula]
+    assert len(calls) == 2
@@ -0,0 +1,39 @@
+from grid.grid_manager import GridManager, CHUNK_SIZE
+
+from tests.test_utils import create_belt, create_generator
+
+
+# in this file we test the chunked spatial index of the grid manager
+
+
+def test_blocks_in_rect_finds_only_overlapping_blocks():
+    grid = GridManager()
+    near = create_belt()
+    far = create_belt()
+    grid.add_block(2, 3, near)
+    grid.add_block(10 * CHUNK_SIZE, 3, far)
+
+    assert grid.blocks_in_rect(0, 5, 0, 5) == [near]
+    assert grid.blocks_in_rect(3, 5, 0, 5) == []
+    assert set(grid.blocks_in_rect(0, 10 * CHUNK_SIZE, 3, 3)) == {near, far}
+
+
+def test_block_on_chunk_border_is_found_once():
+    grid = GridManager()
+    generator = create_generator() # 3x3
+    grid.add_block(CHUNK_SIZE - 1, CHUNK_SIZE - 1, generator)
+
+    assert len(grid.chunks) == 4
+    assert grid.blocks_in_rect(0, 2 * CHUNK_SIZE, 0, 2 * CHUNK_SIZE) == [generator]
+    assert grid.blocks_in_rect(CHUNK_SIZE + 1, CHUNK_SIZE + 1, CHUNK_SIZE + 1, CHUNK_SIZE + 1) == [generator]
+
+
+def test_removed_blocks_leave_the_index():
+    grid = GridManager()
+    grid.add_block(-5, -5, create_belt())
+    grid.add_block(CHUNK_SIZE - 1, 0, create_generator())
+
+    grid.remove_block(-5, -5)
+    grid.remove_block(CHUNK_SIZE, 1) # any tile of the generator
+    assert grid.chunks == {}
+    assert grid.blocks_in_rect(-100, 100, -100, 100) == []
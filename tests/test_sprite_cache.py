@@ -0,0 +1,46 @@
+import pygame
+
+from machines.base.machine import Machine
+from machines.base.machine_database import MachineData
+from machines.base.sprite_cache import SpriteCache, sprite_cache
+
+
+def create_machine_data():
+    data = MachineData(id="test_sprite", name="Test", size=(2, 1), sprite_path="dummy.png", cls=Machine)
+    data.image = pygame.Surface((64, 32), pygame.SRCALPHA)
+    data.rotated_images = [pygame.transform.rotate(data.image, -90 * rotation) for rotation in range(4)]
+    return data
+
+
+def test_rotation_uses_the_pre_rotated_images():
+    data = create_machine_data()
+    machine = Machine(data)
+    for rotation in [1, 2, 3, 0]:
+        machine.rotate(1)
+        assert machine.image is data.get_image(rotation)
+    # no transforms add up
+    assert machine.image.get_size() == (64, 32)
+
+
+def test_machines_share_the_scaled_sprites():
+    data = create_machine_data()
+    machine1 = Machine(data, rotation=1)
+    machine2 = Machine(data, rotation=1)
+
+    sprite = machine1.get_scaled_image((17, 33))
+    assert sprite.get_size() == (17, 33)
+    assert machine2.get_scaled_image((17, 33)) is sprite
+    assert Machine(data).get_scaled_image((17, 33)) is not sprite # other rotation
+    sprite_cache.clear()
+
+
+def test_sprite_cache_removes_least_recently_used_sprite():
+    cache = SpriteCache(max_size=2)
+    image = pygame.Surface((8, 8))
+    small = cache.get("a", image, (4, 4))
+    cache.get("a", image, (2, 2))
+    assert cache.get("a", image, (4, 4)) is small # (2, 2) is now the least recently used
+    cache.get("a", image, (6, 6))
+
+    assert set(size for _, size, _ in cache.sprites) == {(4, 4), (6, 6)}
+    assert cache.hits == 1 and cache.misses == 3
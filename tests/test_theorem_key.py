@@ -0,0 +1,78 @@
+import dataclasses
+import pytest
+
+from core.formula_parser import parse_formula
+from core.theorem_key import TheoremKey
+from entities.item import Item
+from machines.base.machine_database import MachineData
+from machines.types.implication_introduction import ImplicationIntroduction
+from machines.types.or_elimination import OrElimination
+
+
+# in this file we test the theorem keys. The assumptions are stored as bitmask.
+
+
+def test_assumption_mask_operations():
+    a, b, c = parse_formula("a"), parse_formula("b"), parse_formula("c")
+    key_ab = TheoremKey.create(parse_formula("a * b"), [a, b], True)
+    key_b = TheoremKey.create(parse_formula("a * b"), [b], True)
+
+    assert key_ab.has_assumption(a) and key_ab.has_assumption(b)
+    assert not key_ab.has_assumption(c)
+    assert key_ab.assumptions == frozenset([a, b])
+
+    # difference, union and subset
+    assert key_ab.assumption_mask & ~a.assumption_bit == key_b.assumption_mask
+    assert key_b.assumption_mask | a.assumption_bit == key_ab.assumption_mask
+    assert key_b.assumption_mask & key_ab.assumption_mask == key_b.assumption_mask
+
+
+def test_keys_with_the_same_assumptions_are_equal():
+    key1 = TheoremKey.create(parse_formula("a"), [parse_formula("a -> b"), parse_formula("c")], True)
+    key2 = TheoremKey.create(parse_formula("a"), [parse_formula("c"), parse_formula("a->b")], True)
+    assert key1 == key2
+    assert hash(key1) == hash(key2)
+    assert TheoremKey.from_data(key1.to_data()) == key1
+
+
+def test_keys_are_immutable_and_compare_all_fields():
+    formula = parse_formula("a -> a")
+    key = TheoremKey.create(formula, [], True)
+
+    assert key != TheoremKey.create(formula, [], False)
+    assert key != TheoremKey.create(formula, [parse_formula("a")], True)
+    assert key != formula
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        key.is_theorem = False
+
+
+def create_machine(cls, size=(3, 3)):
+    data = MachineData(id="test", name="Test", size=size, sprite_path="dummy.png", cls=cls)
+    return cls(data, origin=(0, 0))
+
+
+def test_implication_introduction_removes_the_premise():
+    a, b = parse_formula("a"), parse_formula("b")
+    machine = create_machine(ImplicationIntroduction)
+    machine.input_items = [Item(a), Item(b, is_theorem=True, assumptions=[a, b])]
+
+    output = machine._process_items()
+    assert output.formula is parse_formula("a -> b")
+    assert output.assumptions == frozenset([b])
+
+
+def test_or_elimination_removes_both_cases():
+    a, b, c = parse_formula("a"), parse_formula("b"), parse_formula("c")
+    machine = create_machine(OrElimination, size=(3, 5))
+
+    or_item = Item(parse_formula("a + b"), is_theorem=True)
+    from_a = Item(c, is_theorem=True, assumptions=[a, c])
+    from_b = Item(c, is_theorem=True, assumptions=[b])
+    assert machine.receive_item_at_port(or_item, machine.ports[2])
+    assert machine.receive_item_at_port(from_a, machine.ports[0])
+    assert machine.receive_item_at_port(from_b, machine.ports[1])
+
+    output = machine._process_items()
+    assert output.formula is c
+    assert output.assumptions == frozenset([c])
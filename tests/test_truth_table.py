@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from core.formula_parser import parse_formula
+from core.theorem_key import TheoremKey
+from core.truth_table import TruthTable, entails, is_tautology
+from machines.base.machine_database import database
+from machines.types.hub import Hub
+
+from tests.test_utils import initialize_pygame
+
+
+# in this file we test the truth-table evaluator, that checks the theorems in the hub.
+
+
+@pytest.mark.parametrize("text", [
+    "a -> a", "a + -a", "(a * b) -> (b * a)", "(a + b) -> (b + a)", "--a -> a", "F -> a", "T",
+    "((a -> b) -> a) -> a",
+])
+def test_tautologies(text):
+    assert is_tautology(parse_formula(text))
+
+
+@pytest.mark.parametrize("text", ["a", "a -> b", "a * -a", "(a + b) -> a", "F"])
+def test_no_tautologies(text):
+    assert not is_tautology(parse_formula(text))
+
+
+def test_entailment():
+    a, b = parse_formula("a"), parse_formula("b")
+    assert entails([a, parse_formula("a -> b")], b)
+    assert entails([a], parse_formula("a + c"))
+    assert entails([parse_formula("a * -a")], parse_formula("x")) # contradiction entails everything
+    assert not entails([a], b)
+
+
+def test_variable_columns():
+    table = TruthTable(parse_formula("a * b").variable_mask)
+    a, b = parse_formula("a"), parse_formula("b")
+    # 4 rows. a and b each are True in exactly 2 of them
+    assert table.all_rows == 0b1111
+    assert table.evaluate(a).bit_count() == 2
+    assert table.evaluate(b).bit_count() == 2
+    assert table.evaluate(parse_formula("a * b")).bit_count() == 1
+
+
+def test_twenty_variables():
+    names = [f"v{i}" for i in range(20)]
+    conjunction = parse_formula(" * ".join(names))
+    disjunction = parse_formula(" + ".join(names))
+
+    start = time.perf_counter()
+    assert is_tautology(parse_formula(f"({' * '.join(names)}) -> ({' + '.join(names)})"))
+    assert entails([conjunction], disjunction)
+    assert not entails([disjunction], conjunction)
+    assert time.perf_counter() - start < 5.0
+
+
+def test_hub_removes_invalid_theorems_when_loading():
+    initialize_pygame()
+    hub = Hub(database.get("hub"))
+    valid = TheoremKey.create(parse_formula("a -> a"), [], True)
+    valid_with_assumptions = TheoremKey.create(parse_formula("a + b"), [parse_formula("a")], True)
+    invalid = TheoremKey.create(parse_formula("a -> b"), [], True)
+    formula = TheoremKey.create(parse_formula("a -> b"), [], False) # not a theorem, so it is not checked
+
+    data = {"storage": [{"key": key.to_data(), "amount": 2} for key in [valid, valid_with_assumptions, invalid, formula]]}
+    hub._load_custom_data(data)
+
+    assert hub.storage == {valid: 2, valid_with_assumptions: 2, formula: 2}
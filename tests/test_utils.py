@@ -44,4 +44,30 @@ def create_generator(rotation=0):
     generator = Generator(data, rotation=rotation)
     generator.init_ports()
     generator.rotate_ports()
-    return generator
\ No newline at end of file
+    return generator
+
+
+# (x, y, rotation) of the belts. A line with a curve, and a belt merging into the side of the line
+BELTS = [(0, 5, 0), (1, 5, 0), (2, 5, 0), (3, 5, 3), (3, 4, 3), (3, 3, 0), (4, 3, 0), (4, 4, 3), (4, 6, 3)]
+
+
+# helper function to place the belts of BELTS and a generator, one by one or in one batch
+def place(grid, batch):
+    blocks = [(x, y, create_belt(rotation=rotation)) for x, y, rotation in BELTS]
+    blocks.append((-1, 0, create_generator()))
+    if batch:
+        grid.begin_batch()
+    for x, y, block in blocks:
+        block.origin = (x, y)
+        grid.add_block(x, y, block)
+    if batch:
+        grid.commit()
+
+
+# helper function to get the io, sprite and connections of all belts (to compare two grids)
+def belt_state(grid):
+    state = {}
+    for origin, block in grid.grid_manager.belts.items():
+        connections = {(port.port_type, port.direction, port.connected_port is not None) for port in block.ports}
+        state[origin] = (set(block.inputs), set(block.outputs), block.sprite_key, connections)
+    return state